@@ -5,113 +5,278 @@ for the home team in each game row.
 """
 
 import csv
+import logging
+import mmap
 import os
+import pickle
+import re
+import sys
+from functools import lru_cache
 
+import numpy as np
+import pandas as pd
+
+@lru_cache(maxsize=None)
 def load_team_zipcode_mapping(zipcode_file: str) -> dict:
     """
     Load team name to zipcode mapping from CSV file.
-    
+
+    The parsed mapping is cached as a pickle next to the CSV (and reused
+    while it is newer than the source), so repeated runs skip the CSV
+    parse entirely. Repeated calls within a process hit the lru_cache.
+
     Args:
         zipcode_file: Path to nfl_teams_stadium_zip_only.csv
-        
+
     Returns:
         Dictionary mapping team names to zipcodes
     """
+    cache_file = zipcode_file + '.pkl'
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(zipcode_file):
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+
     team_zipcode = {}
-    
+
     with open(zipcode_file, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
             team_name = row['Team'].strip()
             zipcode = row['Stadium ZIP Code'].strip()
             team_zipcode[team_name] = zipcode
-    
+
+    with open(cache_file, 'wb') as f:
+        pickle.dump(team_zipcode, f, protocol=pickle.HIGHEST_PROTOCOL)
+
     return team_zipcode
 
-def determine_home_team(row: dict) -> str:
+def scan_away_flags(games_file: str) -> list:
+    """
+    Byte-scan a games CSV for the ',@,' away marker without parsing rows.
+
+    Memory-maps the file and runs find() over the raw bytes of each data
+    line, so no per-row string or field objects are built just to read
+    the one-character flag.
+
+    Args:
+        games_file: Path to games CSV file
+
+    Returns:
+        List with one boolean per data line, in file order
+    """
+    if os.path.getsize(games_file) == 0:
+        return []
+
+    flags = []
+    with open(games_file, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Skip the header line
+            header_end = mm.find(b'\n')
+            if header_end == -1:
+                return []
+            start = header_end + 1
+            size = mm.size()
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = size
+                flags.append(mm.find(b',@,', start, end) != -1)
+                start = end + 1
+        finally:
+            mm.close()
+    return flags
+
+def find_at_index(header) -> int:
+    """
+    Find the index of the column holding the '@' away marker.
+
+    On pro-football-reference CSVs the '@' always lives in the unnamed
+    column between Winner/tie and Loser/tie, so there is no need to scan
+    every cell of every row.
+
+    Args:
+        header: List of column names from the CSV header
+
+    Returns:
+        Index of the '@' marker column, or -1 if not found
+    """
+    for i, name in enumerate(header):
+        if not name or name.startswith('Unnamed'):
+            return i
+    return -1
+
+def determine_home_team(row: list, i_winner: int, i_loser: int, i_at: int) -> str:
     """
     Determine which team is the home team based on the '@' symbol.
-    
+
     Args:
-        row: Dictionary representing a game row
-        
+        row: List of field values for a game row
+        i_winner: Index of the Winner/tie column
+        i_loser: Index of the Loser/tie column
+        i_at: Index of the column holding the '@' away marker
+
     Returns:
         Name of the home team
     """
-    winner = row['Winner/tie'].strip()
-    loser = row['Loser/tie'].strip()
-    
-    # Check if '@' symbol is present in any column value
-    has_at_symbol = any('@' in str(value) for value in row.values())
-    
-    # If '@' is present: winner is Away, loser is Home
-    # If '@' is not present: winner is Home, loser is Away
-    if has_at_symbol:
-        return loser
+    winner = row[i_winner].strip()
+    loser = row[i_loser].strip()
+
+    # Check the single marker column for the '@' symbol
+    has_at_symbol = i_at >= 0 and row[i_at].strip() == '@'
+
+    # Branchless select: '@' present means the winner played away,
+    # so the loser is the home team
+    return (winner, loser)[has_at_symbol]
+
+def compute_away_series(df: pd.DataFrame, games_file: str = None) -> pd.Series:
+    """
+    Build the boolean 'winner played away' Series for a games frame.
+
+    Prefers the mmap byte scan of the source file when available; falls
+    back to testing the parsed '@' marker column whenever the line count
+    disagrees with the row count (e.g. quoted newlines).
+
+    Args:
+        df: Games DataFrame as read from CSV
+        games_file: Path of the source CSV, for the byte-scan fast path
+
+    Returns:
+        Boolean Series aligned with df, True where the winner was away
+    """
+    if games_file is not None:
+        flags = scan_away_flags(games_file)
+        if len(flags) == len(df):
+            return pd.Series(flags, index=df.index)
+
+    i_at = find_at_index(list(df.columns))
+    if i_at >= 0:
+        return df.iloc[:, i_at].eq('@')
+    return pd.Series(False, index=df.index)
+
+def attach_zipcodes(df: pd.DataFrame, team_zipcode: dict, away: pd.Series) -> set:
+    """
+    Add or update the 'zipcode' column on a games frame in place.
+
+    Args:
+        df: Games DataFrame with all cells as verbatim strings
+        team_zipcode: Dictionary mapping team names to zipcodes
+        away: Boolean Series, True where the winner played away
+
+    Returns:
+        Set of home team names with no zipcode mapping
+    """
+    # Rows with both teams present are actual games
+    played = df['Winner/tie'].ne('') & df['Loser/tie'].ne('')
+
+    # Branchless home-team selection across the whole frame
+    home_team = pd.Series(
+        np.where(away, df['Loser/tie'].str.strip(), df['Winner/tie'].str.strip()),
+        index=df.index)
+
+    # Single vectorized dict join instead of a per-row dict.get
+    zipcode = home_team.map(team_zipcode)
+    missing_teams = set(home_team[played & (zipcode.isna() | zipcode.eq(''))])
+    zipcode = zipcode.fillna('')
+
+    # Leave non-game rows untouched
+    if 'zipcode' in df.columns:
+        df.loc[played, 'zipcode'] = zipcode[played]
     else:
-        return winner
+        df['zipcode'] = zipcode.where(played, '')
+
+    return missing_teams
 
-def add_zipcodes_to_games(games_file: str, zipcode_file: str, output_file: str = None):
+def restore_header(columns) -> list:
+    """
+    Undo pandas' read_csv header mangling for write-back.
+
+    pandas renames empty header cells to 'Unnamed: N' and deduplicates
+    repeated names to 'Name.1'; restore the original spellings so the
+    games file round-trips unchanged.
+
+    Args:
+        columns: DataFrame columns as parsed by read_csv
+
+    Returns:
+        List of column names as they appeared in the source file
+    """
+    return ['' if c.startswith('Unnamed') else re.sub(r'\.\d+$', '', c) for c in columns]
+
+def write_games_csv(df: pd.DataFrame, output_file: str):
+    """
+    Write a games frame back to CSV, restoring the original header and
+    replacing the destination atomically via a temp file.
+
+    Args:
+        df: Games DataFrame to write
+        output_file: Destination CSV path
+    """
+    temp_file = output_file + '.tmp'
+    df.to_csv(temp_file, index=False, header=restore_header(df.columns))
+    os.replace(temp_file, output_file)
+
+def add_zipcodes_to_games(games_file: str, zipcode_file: str, output_file: str = None,
+                          chunksize: int = None):
     """
     Add zipcode column to games CSV file based on home team.
-    
+
     Args:
         games_file: Path to games CSV file (e.g., 2023_games.csv)
         zipcode_file: Path to team-zipcode mapping file
         output_file: Path to output file (if None, overwrites input file)
+        chunksize: If set, stream the CSV in chunks of this many rows so
+            peak memory stays bounded regardless of file size
     """
     # Load team to zipcode mapping
-    print(f"Loading team-zipcode mapping from {zipcode_file}...")
+    logging.info("Loading team-zipcode mapping from %s...", zipcode_file)
     team_zipcode = load_team_zipcode_mapping(zipcode_file)
-    print(f"Loaded {len(team_zipcode)} team mappings")
-    
-    # Read games file and add zipcodes
-    rows = []
-    missing_teams = set()
-    
-    print(f"\nReading games from {games_file}...")
-    with open(games_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        
-        # Add 'zipcode' column if it doesn't exist
-        if 'zipcode' not in fieldnames:
-            fieldnames = list(fieldnames) + ['zipcode']
-        
-        for row in reader:
-            # Skip empty rows
-            if not row.get('Winner/tie') or not row.get('Loser/tie'):
-                rows.append(row)
-                continue
-            
-            # Determine home team
-            home_team = determine_home_team(row)
-            
-            # Look up zipcode
-            zipcode = team_zipcode.get(home_team, '')
-            if not zipcode:
-                missing_teams.add(home_team)
-            
-            # Add zipcode to row
-            row['zipcode'] = zipcode
-            rows.append(row)
-    
-    # Write updated data
+    logging.info("Loaded %d team mappings", len(team_zipcode))
+
     if output_file is None:
         output_file = games_file
-    
-    print(f"\nWriting updated data to {output_file}...")
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    
-    print(f"Successfully processed {len(rows)} rows")
-    
+
+    logging.info("Reading games from %s...", games_file)
+
+    if chunksize:
+        # Chunked path: attach and append one slice at a time, reading
+        # the '@' marker column per chunk (the whole-file byte scan can't
+        # be validated against a row count that isn't known yet). When
+        # overwriting in place, write to a temp file and swap at the end
+        # so the source is never read and truncated at once.
+        missing_teams = set()
+        total = 0
+        dest = output_file + '.tmp' if output_file == games_file else output_file
+        first = True
+        with open(dest, 'w', newline='', encoding='utf-8') as f:
+            for chunk in pd.read_csv(games_file, dtype=str,
+                                     keep_default_na=False, chunksize=chunksize):
+                away = compute_away_series(chunk)
+                missing_teams |= attach_zipcodes(chunk, team_zipcode, away)
+                chunk.to_csv(f, index=False,
+                             header=restore_header(chunk.columns) if first else False)
+                first = False
+                total += len(chunk)
+        if dest != output_file:
+            os.replace(dest, output_file)
+        logging.info("Successfully processed %d rows", total)
+    else:
+        # Read every cell verbatim as strings so numeric columns, blanks,
+        # and the playoff separator rows round-trip unchanged
+        df = pd.read_csv(games_file, dtype=str, keep_default_na=False)
+
+        away = compute_away_series(df, games_file)
+        missing_teams = attach_zipcodes(df, team_zipcode, away)
+
+        logging.info("Writing updated data to %s...", output_file)
+        write_games_csv(df, output_file)
+
+        logging.info("Successfully processed %d rows", len(df))
+
     if missing_teams:
         print(f"\nWarning: Could not find zipcode for {len(missing_teams)} team(s):")
-        for team in sorted(missing_teams):
-            print(f"  - {team}")
+        # One buffered write instead of a flush per team
+        sys.stdout.write('\n'.join(f"  - {team}" for team in sorted(missing_teams)) + '\n')
     else:
         print("\nAll teams matched successfully!")
 
@@ -128,15 +293,21 @@ def main():
                        help='Path to team-zipcode mapping file (default: dev_data/nfl_teams_stadium_zip_only_5digit_text.csv)')
     parser.add_argument('--output', type=str, default=None,
                        help='Output file path (default: overwrites input file)')
-    
+    parser.add_argument('--chunksize', type=int, default=None,
+                       help='Process the input in chunks of this many rows (bounded memory)')
+
     args = parser.parse_args()
-    
+
+    # Progress goes through logging so batch runs can suppress it
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     print("=" * 70)
     print("NFL Games Zipcode Adder")
     print("=" * 70)
     print()
     
-    add_zipcodes_to_games(args.games_file, args.zipcode_file, args.output)
+    add_zipcodes_to_games(args.games_file, args.zipcode_file, args.output,
+                          chunksize=args.chunksize)
     
     print()
     print("=" * 70)
@@ -4,106 +4,174 @@ Reads {year}_games.csv and outputs {year}_game_ratings.csv with ratings for each
 """
 
 import argparse
-import csv
 import os
-from model import NFLModel1
+import numpy as np
+import pandas as pd
+from model import defensive_rating_v2_vec, offensive_rating_v2_vec
 
-def read_and_calculate_ratings(input_file: str, output_file: str):
+def read_games_csv(input_file: str) -> pd.DataFrame:
+    """
+    Read a games CSV into a DataFrame, preferring the multithreaded
+    pyarrow parser over the default single-threaded one.
+
+    Args:
+        input_file: Path to input CSV file
+
+    Returns:
+        DataFrame of raw game rows
+    """
+    try:
+        return pd.read_csv(input_file, engine='pyarrow')
+    except ImportError:
+        # pyarrow not installed; fall back to the default parser
+        return pd.read_csv(input_file)
+
+def project_games(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Project a raw games DataFrame down to the columns the rating pipeline
+    needs, adding a boolean 'away' column derived from the '@' marker.
+
+    Args:
+        df: Raw games DataFrame as parsed from CSV
+
+    Returns:
+        DataFrame with teams, the six stat columns, and 'away'
+    """
+    # The '@' lives in the unnamed column between Winner/tie and Loser/tie;
+    # '@' present means the winner played away. The default pandas parser
+    # names that column 'Unnamed: 5', the pyarrow engine leaves it ''.
+    # A file without the marker column means every winner played at home.
+    at_col = next((c for c in df.columns if not c or str(c).startswith('Unnamed')), None)
+
+    games = df[['Winner/tie', 'Loser/tie', 'PtsW', 'PtsL', 'YdsW', 'YdsL', 'TOW', 'TOL']].copy()
+    games['away'] = df[at_col].eq('@') if at_col is not None else False
+    return games
+
+def load_games(input_file: str) -> pd.DataFrame:
+    """
+    Load the columns needed for rating calculation, using a Parquet cache
+    next to the CSV when it is newer than the source.
+
+    Source files change rarely, so reruns skip CSV tokenization entirely
+    and read back typed columnar data. The cache holds only Winner/tie,
+    Loser/tie, the six stat columns, and a precomputed boolean 'away'
+    column derived from the '@' marker.
+
+    Args:
+        input_file: Path to input CSV file
+
+    Returns:
+        DataFrame with the projected game columns
+    """
+    base, ext = os.path.splitext(input_file)
+    cache_file = base + '.parquet'
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(input_file):
+        return pd.read_parquet(cache_file)
+
+    df = read_games_csv(input_file)
+    games = project_games(df)
+
+    try:
+        games.to_parquet(cache_file, compression='zstd')
+    except (ImportError, OSError):
+        # No parquet engine (or unwritable directory); skip the cache
+        pass
+
+    return games
+
+def compute_ratings(games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute per-team offensive/defensive ratings for a projected games frame.
+
+    The whole frame is processed as vectorized numpy expressions on the
+    PtsW/PtsL/YdsW/YdsL/TOW/TOL columns instead of a per-row Python loop.
+
+    Args:
+        games: DataFrame from project_games/load_games
+
+    Returns:
+        DataFrame with one row per team per game (winner and loser rows
+        interleaved), ready to write
+    """
+    # Skip empty rows or playoff header rows
+    df = games.dropna(subset=['Winner/tie', 'Loser/tie'])
+
+    away = df['away']
+
+    # Coerce the stat columns to numbers and drop rows with missing/invalid data
+    stat_cols = ['PtsW', 'PtsL', 'YdsW', 'YdsL', 'TOW', 'TOL']
+    stats = df[stat_cols].apply(pd.to_numeric, errors='coerce')
+    bad = stats.isna().any(axis=1)
+    if bad.any():
+        print(f"Warning: Skipping {int(bad.sum())} row(s) due to missing/invalid data")
+        df = df[~bad]
+        away = away[~bad]
+        stats = stats[~bad]
+    stats = stats.astype('int64')
+
+    pts_w, pts_l = stats['PtsW'], stats['PtsL']
+    yds_w, yds_l = stats['YdsW'], stats['YdsL']
+    to_w, to_l = stats['TOW'], stats['TOL']
+
+    # Offensive rating v2: yards term + points term + turnover differential
+    off_w = offensive_rating_v2_vec(yds_w, pts_w, to_w, to_l)
+    off_l = offensive_rating_v2_vec(yds_l, pts_l, to_l, to_w)
+
+    # Defensive rating v2: computed from the opposing team's yards, points, turnovers
+    def_w = defensive_rating_v2_vec(yds_l, pts_l, to_l)
+    def_l = defensive_rating_v2_vec(yds_w, pts_w, to_w)
+
+    winners = pd.DataFrame({
+        'team': df['Winner/tie'].str.strip(),
+        'score': pts_w,
+        'win_lose': 'W',
+        'home_away': np.where(away, 'Away', 'Home'),
+        'offensive_rating': off_w.round(3),
+        'defensive_rating': def_w.round(3)
+    })
+    losers = pd.DataFrame({
+        'team': df['Loser/tie'].str.strip(),
+        'score': pts_l,
+        'win_lose': 'L',
+        'home_away': np.where(away, 'Home', 'Away'),
+        'offensive_rating': off_l.round(3),
+        'defensive_rating': def_l.round(3)
+    })
+
+    # Interleave winner/loser rows so each game stays on adjacent lines
+    return pd.concat([winners, losers]).sort_index(kind='stable')
+
+def read_and_calculate_ratings(input_file: str, output_file: str, chunksize: int = None):
     """
     Read game data from CSV file and calculate offensive/defensive ratings for each team.
-    
+
     Args:
         input_file: Path to input CSV file (2022_games.csv)
         output_file: Path to output CSV file (2022_game_ratings.csv)
+        chunksize: If set, stream the CSV in chunks of this many rows so
+            peak memory stays bounded regardless of file size
     """
-    # Initialize the model
-    model = NFLModel1()
-    results = []
-    
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            # Skip empty rows or playoff header rows
-            if not row.get('Winner/tie') or not row.get('Loser/tie'):
-                continue
-            
-            # Extract fields
-            winner_team = row['Winner/tie'].strip()
-            loser_team = row['Loser/tie'].strip()
-            
-            # Check for '@' in the empty column between Winner/tie and Loser/tie
-            # The '@' indicates the winner is away
-            # Check all values in the row for '@' symbol
-            has_at_symbol = any('@' in str(value) for value in row.values())
-            
-            # Determine home/away
-            # If '@' is present: winner is Away, loser is Home
-            # If '@' is not present: winner is Home, loser is Away
-            if has_at_symbol:
-                winner_home_away = 'Away'
-                loser_home_away = 'Home'
-            else:
-                winner_home_away = 'Home'
-                loser_home_away = 'Away'
-            
-            try:
-                winner_score = int(row['PtsW'])
-                loser_score = int(row['PtsL'])
-                winner_yards = int(row['YdsW'])
-                loser_yards = int(row['YdsL'])
-                winner_turnovers = int(row['TOW'])
-                loser_turnovers = int(row['TOL'])
-            except (ValueError, KeyError) as e:
-                print(f"Warning: Skipping row due to missing/invalid data: {e}")
-                continue
-            
-            # Calculate offensive rating for winner (using winner's yards and points)
-            winner_off_rating = model.offensive_rating_v2(winner_yards, winner_score, winner_turnovers, loser_turnovers)
-            
-            # Calculate defensive rating for winner (using loser's yards, points, and turnovers)
-            winner_def_rating = model.defensive_rating_v2(loser_yards, loser_score, loser_turnovers)
-            
-            # Calculate offensive rating for loser (using loser's yards and points)
-            loser_off_rating = model.offensive_rating_v2(loser_yards, loser_score, loser_turnovers, winner_turnovers)
-            
-            # Calculate defensive rating for loser (using winner's yards, points, and turnovers)
-            loser_def_rating = model.defensive_rating_v2(winner_yards, winner_score, winner_turnovers)
-            
-            # Add winner row
-            results.append({
-                'team': winner_team,
-                'score': winner_score,
-                'win_lose': 'W',
-                'home_away': winner_home_away,
-                'offensive_rating': round(winner_off_rating, 3),
-                'defensive_rating': round(winner_def_rating, 3)
-            })
-            
-            # Add loser row
-            results.append({
-                'team': loser_team,
-                'score': loser_score,
-                'win_lose': 'L',
-                'home_away': loser_home_away,
-                'offensive_rating': round(loser_off_rating, 3),
-                'defensive_rating': round(loser_def_rating, 3)
-            })
-    
     # Create output directory if it doesn't exist
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
-    # Write results to output CSV
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['team', 'score', 'win_lose', 'home_away', 'offensive_rating', 'defensive_rating']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        
-        writer.writeheader()
-        writer.writerows(results)
-    
-    print(f"Successfully processed {len(results)} team-game records")
+
+    if chunksize:
+        # Chunked path: parse, compute, and append one chunk at a time
+        total = 0
+        first = True
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            for chunk in pd.read_csv(input_file, chunksize=chunksize):
+                results = compute_ratings(project_games(chunk))
+                results.to_csv(f, header=first, index=False)
+                first = False
+                total += len(results)
+    else:
+        results = compute_ratings(load_games(input_file))
+        results.to_csv(output_file, index=False)
+        total = len(results)
+
+    print(f"Successfully processed {total} team-game records")
     print(f"Results saved to {output_file}")
-    print(f"Total games processed: {len(results) // 2}")
+    print(f"Total games processed: {total // 2}")
 
 def main():
     """Main function to run the rating calculation."""
@@ -113,7 +181,9 @@ def main():
                        help='Directory containing input CSV files (default: dev_data)')
     parser.add_argument('--output-dir', type=str, default='dev_data',
                        help='Directory for output CSV files (default: dev_data)')
-    
+    parser.add_argument('--chunksize', type=int, default=None,
+                       help='Process the input in chunks of this many rows (bounded memory)')
+
     args = parser.parse_args()
     
     input_file = os.path.join(args.input_dir, f'{args.year}_games.csv')
@@ -128,7 +198,7 @@ def main():
     print(f"Writing to: {output_file}")
     print()
     
-    read_and_calculate_ratings(input_file, output_file)
+    read_and_calculate_ratings(input_file, output_file, chunksize=args.chunksize)
     
     print()
     print("=" * 70)
@@ -1,77 +1,190 @@
 import math
 
+import numpy as np
+
+# Bind sqrt locally and fold the constant factors once at import time so
+# the scalar hot path avoids module attribute lookups and re-deriving
+# the same constants on every call.
+_SQRT = math.sqrt
+
+# sqrt(p * k) == sqrt(k) * sqrt(p), so the points coefficients fold into
+# single multipliers: 5 * sqrt(5 * sqrt(2) * 0.6) for v1, 10 * sqrt(...) for v2
+_PTS_COEF = 5 * math.sqrt(5 * math.sqrt(2) * 0.6)
+_PTS_COEF_V2 = 10 * math.sqrt(5 * math.sqrt(2) * 0.6)
+
+_INV_72 = 1 / 72
+_INV_350 = 1 / 350
+_PTS_DEF = 1.3 / 11
+_PTS_DEF_V2 = 1.3 / 20
+
+def _jit(func):
+    """Compile a scalar kernel with numba when it is installed; otherwise
+    return the plain Python function."""
+    try:
+        from numba import njit
+    except ImportError:
+        return func
+    return njit(cache=True)(func)
+
+# Scalar kernels for the hot loop fallback path. With numba installed the
+# sqrt is emitted as native code and interpreter dispatch disappears.
+@_jit
+def _off_rating(yards, points):
+    return _SQRT(yards / 5 + 40) * 2 + _SQRT(points) * _PTS_COEF
+
+@_jit
+def _off_rating_v2(yards, points, turnovers, op_turnovers):
+    return _SQRT(yards / 5 + 40) * 0.5 + _SQRT(points) * _PTS_COEF_V2 + \
+        (op_turnovers - turnovers) * 10
+
+@_jit
+def _def_rating(yards_op, points_op, to_op):
+    return yards_op * _INV_72 - (25 * to_op + 72) * _INV_72 + points_op * _PTS_DEF
+
+@_jit
+def _def_rating_v2(yards_op, points_op, to_op):
+    return yards_op * _INV_350 - (25 * to_op + 72) * _INV_72 + points_op * _PTS_DEF_V2
+
+def offensive_rating(yards: int, points: int) -> float:
+    """
+    Offensive rating is a measure of a team's offensive performance.
+    It is calculated by taking the square root of the team's yards per game plus 40,
+    multiplying by 2, and adding the square root of the team's points per game multiplied by 5,
+    multiplied by the square root of 2, multiplied by 0.6.
+
+    Args:
+        yards: The number of yards the team has gained.
+        points: The number of points the team has scored.
+
+    Returns:
+        The offensive rating of the team.
+    """
+    return _off_rating(yards, points)
+
+def offensive_rating_v2(yards: int, points: int, turnovers: int, op_turnovers: int) -> float:
+    """
+    Offensive rating is a measure of a team's offensive performance.
+    It is calculated by taking the square root of the team's yards per game plus 40,
+    multiplying by 2, and adding the square root of the team's points per game multiplied by 5,
+    multiplied by the square root of 2, multiplied by 0.6.
+
+    Args:
+        yards: The number of yards the team has gained.
+        points: The number of points the team has scored.
+        turnovers: The number of turnovers the team has committed.
+        op_turnovers: The number of turnovers the opposing team has committed.
+    Returns:
+        The offensive rating of the team.
+    """
+    return _off_rating_v2(yards, points, turnovers, op_turnovers)
+
+def defensive_rating(yards_op: int, points_op: int, to_op: int) -> float:
+    """
+    Defensive rating is a measure of a team's defensive performance.
+    It is calculated by taking the opposing team's yards per game divided by 72,
+    subtracting (25 * turnovers + 72) / 72, and adding 1.3 * points per game divided by 11.
+
+    Args:
+        yards_op: The number of yards the opposing team has gained.
+        points_op: The number of points the opposing team has scored.
+        to_op: The number of turnovers the opposing team has committed.
+
+    Returns:
+        The defensive rating of the team.
+    """
+    return _def_rating(yards_op, points_op, to_op)
+
+def defensive_rating_v2(yards_op: int, points_op: int, to_op: int) -> float:
+    """
+    Defensive rating is a measure of a team's defensive performance.
+    It is calculated by taking the opposing team's yards per game divided by 72,
+    subtracting (25 * turnovers + 72) / 72, and adding 1.3 * points per game divided by 20.
+
+    Args:
+        yards_op: The number of yards the opposing team has gained.
+        points_op: The number of points the opposing team has scored.
+        to_op: The number of turnovers the opposing team has committed.
+
+    Returns:
+        The defensive rating of the team.
+    """
+    return _def_rating_v2(yards_op, points_op, to_op)
+
+def offensive_rating_vec(yards, points):
+    """
+    Vectorized offensive_rating: accepts numpy arrays (or pandas Series)
+    of yards and points and returns an array of ratings, so whole-season
+    callers avoid a Python-level loop.
+
+    Args:
+        yards: Array of yards gained per game.
+        points: Array of points scored per game.
+
+    Returns:
+        Array of offensive ratings.
+    """
+    return np.sqrt(yards / 5 + 40) * 2 + np.sqrt(points) * _PTS_COEF
+
+def offensive_rating_v2_vec(yards, points, turnovers, op_turnovers):
+    """
+    Vectorized offensive_rating_v2: accepts numpy arrays (or pandas
+    Series) and returns an array of ratings.
+
+    Args:
+        yards: Array of yards gained per game.
+        points: Array of points scored per game.
+        turnovers: Array of turnovers committed per game.
+        op_turnovers: Array of turnovers committed by the opposing team.
+
+    Returns:
+        Array of offensive ratings.
+    """
+    return np.sqrt(yards / 5 + 40) * 0.5 + np.sqrt(points) * _PTS_COEF_V2 + \
+        (op_turnovers - turnovers) * 10
+
+def defensive_rating_vec(yards_op, points_op, to_op):
+    """
+    Vectorized defensive_rating: accepts numpy arrays (or pandas Series)
+    of the opposing team's yards, points, and turnovers.
+
+    Args:
+        yards_op: Array of yards gained by the opposing team.
+        points_op: Array of points scored by the opposing team.
+        to_op: Array of turnovers committed by the opposing team.
+
+    Returns:
+        Array of defensive ratings.
+    """
+    return yards_op * _INV_72 - (25 * to_op + 72) * _INV_72 + points_op * _PTS_DEF
+
+def defensive_rating_v2_vec(yards_op, points_op, to_op):
+    """
+    Vectorized defensive_rating_v2: accepts numpy arrays (or pandas
+    Series) of the opposing team's yards, points, and turnovers.
+
+    Args:
+        yards_op: Array of yards gained by the opposing team.
+        points_op: Array of points scored by the opposing team.
+        to_op: Array of turnovers committed by the opposing team.
+
+    Returns:
+        Array of defensive ratings.
+    """
+    return yards_op * _INV_350 - (25 * to_op + 72) * _INV_72 + points_op * _PTS_DEF_V2
+
 class NFLModel1:
-    def __init__(self):
-        pass
-
-    def offensive_rating(self, yards: int, points: int) -> float:
-        """
-        Offensive rating is a measure of a team's offensive performance.
-        It is calculated by taking the square root of the team's yards per game plus 40,
-        multiplying by 2, and adding the square root of the team's points per game multiplied by 5,
-        multiplied by the square root of 2, multiplied by 0.6.
-
-        Args:
-            yards: The number of yards the team has gained.
-            points: The number of points the team has scored.
-
-        Returns:
-            The offensive rating of the team.
-        """
-        return math.sqrt(yards / 5 +40) * 2 + \
-            math.sqrt(points * 5 * math.sqrt(2) * 0.6) * 5
-    
-    
-
-    def offensive_rating_v2(self, yards: int, points: int, turnovers: int, op_turnovers: int) -> float:
-        """
-        Offensive rating is a measure of a team's offensive performance.
-        It is calculated by taking the square root of the team's yards per game plus 40,
-        multiplying by 2, and adding the square root of the team's points per game multiplied by 5,
-        multiplied by the square root of 2, multiplied by 0.6.
-
-        Args:
-            yards: The number of yards the team has gained.
-            points: The number of points the team has scored.
-            turnovers: The number of turnovers the team has committed.
-            op_turnovers: The number of turnovers the opposing team has committed.  
-        Returns:
-            The offensive rating of the team.
-        """
-        return math.sqrt(yards / 5 +40) * 0.5 + \
-            math.sqrt(points * 5 * math.sqrt(2) * 0.6) * 10 + \
-            (op_turnovers - turnovers) * 10
-
-    def defensive_rating(self, yards_op: int, points_op: int, to_op: int) -> float:
-        """
-        Defensive rating is a measure of a team's defensive performance.
-        It is calculated by taking the opposing team's yards per game divided by 72,
-        subtracting (25 * turnovers + 72) / 72, and adding 1.3 * points per game divided by 11.
-
-        Args:
-            yards_op: The number of yards the opposing team has gained.
-            points_op: The number of points the opposing team has scored.
-            to_op: The number of turnovers the opposing team has committed.
-
-        Returns:
-            The defensive rating of the team.
-        """
-        return yards_op / 72 - (25 * to_op + 72) / 72  + 1.3 * points_op / 11
-
-    def defensive_rating_v2(self, yards_op: int, points_op: int, to_op: int) -> float:
-        """
-        Defensive rating is a measure of a team's defensive performance.
-        It is calculated by taking the opposing team's yards per game divided by 72,
-        subtracting (25 * turnovers + 72) / 72, and adding 1.3 * points per game divided by 11.
-
-        Args:
-            yards_op: The number of yards the opposing team has gained.
-            points_op: The number of points the opposing team has scored.
-            to_op: The number of turnovers the opposing team has committed.
-
-        Returns:
-            The defensive rating of the team.
-        """
-        return yards_op / 350 - (25 * to_op + 72) / 72  + 1.3 * points_op / 20
-
-    
\ No newline at end of file
+    """
+    Thin compatibility shim over the module-level rating functions.
+
+    The methods never touched self, so the functions now live at module
+    scope; existing callers holding an NFLModel1 instance keep working.
+    """
+
+    offensive_rating = staticmethod(offensive_rating)
+    offensive_rating_v2 = staticmethod(offensive_rating_v2)
+    defensive_rating = staticmethod(defensive_rating)
+    defensive_rating_v2 = staticmethod(defensive_rating_v2)
+    offensive_rating_vec = staticmethod(offensive_rating_vec)
+    offensive_rating_v2_vec = staticmethod(offensive_rating_v2_vec)
+    defensive_rating_vec = staticmethod(defensive_rating_vec)
+    defensive_rating_v2_vec = staticmethod(defensive_rating_v2_vec)
@@ -0,0 +1,128 @@
+"""
+Fused season pipeline.
+Reads a {year}_games.csv once and emits both the zipcode-augmented games
+file and the per-game ratings file from the same parsed frame, instead of
+tokenizing the CSV and re-detecting the '@' marker in each script.
+"""
+
+import argparse
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+from add_zipcodes import (attach_zipcodes, compute_away_series,
+                          load_team_zipcode_mapping, write_games_csv)
+from calculate_rating_per_game import compute_ratings
+
+def process_season(games_file: str, zipcode_file: str, games_out: str = None,
+                   ratings_out: str = None):
+    """
+    Process one season file in a single pass.
+
+    Args:
+        games_file: Path to input games CSV file
+        zipcode_file: Path to team-zipcode mapping file
+        games_out: Path for the zipcode-augmented games CSV (skipped if None)
+        ratings_out: Path for the per-game ratings CSV (skipped if None)
+    """
+    # Create output directories before any write
+    for out in (games_out, ratings_out):
+        if out is not None:
+            os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+
+    print(f"Reading games from {games_file}...")
+    # Read verbatim strings so the games file round-trips unchanged; the
+    # rating computation coerces its stat columns itself
+    df = pd.read_csv(games_file, dtype=str, keep_default_na=False)
+
+    away = compute_away_series(df, games_file)
+    played = df['Winner/tie'].ne('') & df['Loser/tie'].ne('')
+
+    if games_out is not None:
+        team_zipcode = load_team_zipcode_mapping(zipcode_file)
+        missing_teams = attach_zipcodes(df, team_zipcode, away)
+        print(f"Writing games with zipcodes to {games_out}...")
+        write_games_csv(df, games_out)
+        if missing_teams:
+            print(f"Warning: Could not find zipcode for {len(missing_teams)} team(s): "
+                  + ', '.join(sorted(missing_teams)))
+
+    if ratings_out is not None:
+        games = df.loc[played, ['Winner/tie', 'Loser/tie',
+                                'PtsW', 'PtsL', 'YdsW', 'YdsL', 'TOW', 'TOL']].copy()
+        games['away'] = away[played]
+        results = compute_ratings(games)
+        results.to_csv(ratings_out, index=False)
+        print(f"Writing ratings for {len(results) // 2} games to {ratings_out}...")
+
+def process_file(games_file: str, zipcode_file: str, output_dir: str):
+    """
+    Process a single season file, deriving output paths from its name.
+
+    Args:
+        games_file: Path to input games CSV file
+        zipcode_file: Path to team-zipcode mapping file
+        output_dir: Directory for output CSV files
+    """
+    stem = os.path.splitext(os.path.basename(games_file))[0]
+    games_out = os.path.join(output_dir, stem + '.csv')
+    ratings_out = os.path.join(output_dir, stem.replace('_games', '_game_ratings_v2') + '.csv')
+    process_season(games_file, zipcode_file, games_out, ratings_out)
+
+def main():
+    """Main function to run the fused pipeline for one or many seasons."""
+    parser = argparse.ArgumentParser(
+        description='Add zipcodes and calculate game ratings in a single pass over a season file')
+    parser.add_argument('--year', type=int, default=None, help='Year to process (e.g., 2022)')
+    parser.add_argument('--games-glob', type=str, default=None,
+                       help="Glob of season files to process in parallel (e.g. 'dev_data/20*_games.csv')")
+    parser.add_argument('--input-dir', type=str, default='dev_data',
+                       help='Directory containing input CSV files (default: dev_data)')
+    parser.add_argument('--output-dir', type=str, default='dev_data',
+                       help='Directory for output CSV files (default: dev_data)')
+    parser.add_argument('--zipcode-file', type=str,
+                       default='dev_data/nfl_teams_stadium_zip_only_5digit_text.csv',
+                       help='Path to team-zipcode mapping file (default: dev_data/nfl_teams_stadium_zip_only_5digit_text.csv)')
+
+    args = parser.parse_args()
+
+    if args.year is None and args.games_glob is None:
+        parser.error('one of --year or --games-glob is required')
+
+    print("=" * 70)
+    print("NFL Season Pipeline")
+    print("=" * 70)
+    print()
+
+    if args.games_glob:
+        # Season files are independent, so fan out across cores; the
+        # computation is CPU-bound once vectorized, hence processes
+        files = sorted(glob.glob(args.games_glob))
+        if not files:
+            print(f"Error: No files match {args.games_glob}")
+            return
+        print(f"Processing {len(files)} season file(s) in parallel...")
+        print()
+        worker = partial(process_file, zipcode_file=args.zipcode_file,
+                         output_dir=args.output_dir)
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(worker, files))
+    else:
+        games_file = os.path.join(args.input_dir, f'{args.year}_games.csv')
+        games_out = os.path.join(args.output_dir, f'{args.year}_games.csv')
+        ratings_out = os.path.join(args.output_dir, f'{args.year}_game_ratings_v2.csv')
+        print(f"Year: {args.year}")
+        print(f"Reading from: {games_file}")
+        print()
+        process_season(games_file, args.zipcode_file, games_out, ratings_out)
+
+    print()
+    print("=" * 70)
+    print("Processing complete!")
+    print("=" * 70)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Team Zipcode Perfect-Hash Builder
+Reads the team-zipcode mapping CSV and generates team_zipcode_phf.py,
+a module with a collision-free hash table over the 32 known team names
+so scalar lookups are a single array index instead of a dict probe.
+
+The generated module is an on-demand artifact for scripts doing scalar
+one-off lookups; the pipeline itself resolves zipcodes with a vectorized
+Series.map, so the module is not committed to the repo.
+"""
+
+import argparse
+import csv
+import os
+
+def load_mapping(zipcode_file):
+    """
+    Load the team -> zipcode mapping from the stadium CSV.
+
+    Args:
+        zipcode_file: Path to the team-zipcode mapping CSV
+
+    Returns:
+        Dictionary mapping team names to zipcodes
+    """
+    mapping = {}
+    with open(zipcode_file, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            mapping[row['Team'].strip()] = row['Stadium ZIP Code'].strip()
+    return mapping
+
+def find_perfect_hash(keys):
+    """
+    Brute-force a small perfect hash over the known key set.
+
+    The hash mixes the first two, middle, and last characters with the length;
+    search over table sizes and salt pairs until no two keys collide.
+
+    Args:
+        keys: List of key strings
+
+    Returns:
+        Tuple of (s1, s2, size) producing no collisions
+    """
+    for size in range(len(keys), 4 * len(keys)):
+        for s1 in range(1, 64):
+            for s2 in range(1, 64):
+                slots = set()
+                for key in keys:
+                    i = (s1 * ord(key[0]) + s2 * ord(key[1]) + ord(key[len(key) // 2]) + ord(key[-1]) + len(key)) % size
+                    if i in slots:
+                        break
+                    slots.add(i)
+                else:
+                    return s1, s2, size
+    raise RuntimeError(f"No perfect hash found for {len(keys)} keys")
+
+def generate_module(mapping, output_file, source_file):
+    """
+    Write the generated lookup module.
+
+    Args:
+        mapping: Dictionary mapping team names to zipcodes
+        output_file: Path of the module to write
+        source_file: Path of the CSV the table was built from
+    """
+    keys = sorted(mapping)
+    s1, s2, size = find_perfect_hash(keys)
+
+    slots = [''] * size
+    zips = [''] * size
+    for key in keys:
+        i = (s1 * ord(key[0]) + s2 * ord(key[1]) + ord(key[len(key) // 2]) + ord(key[-1]) + len(key)) % size
+        slots[i] = key
+        zips[i] = mapping[key]
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write('"""\n')
+        f.write(f'Generated by tools/build_team_zipcode_phf.py from {source_file}.\n')
+        f.write('Do not edit by hand; regenerate when the stadium CSV changes.\n')
+        f.write('"""\n\n')
+        f.write(f'_S1 = {s1}\n')
+        f.write(f'_S2 = {s2}\n')
+        f.write(f'_SIZE = {size}\n\n')
+        f.write(f'_KEYS = {tuple(slots)!r}\n\n')
+        f.write(f'_ZIPS = {tuple(zips)!r}\n\n')
+        f.write('def zipcode_for(team: str) -> str:\n')
+        f.write('    """\n')
+        f.write('    Look up the stadium zipcode for a team name.\n\n')
+        f.write('    Uses a collision-free hash over the known team set, so the\n')
+        f.write('    lookup is one multiply and one array index. Unknown names\n')
+        f.write("    return ''.\n")
+        f.write('    """\n')
+        f.write('    if len(team) < 2:\n')
+        f.write("        return ''\n")
+        f.write('    i = (_S1 * ord(team[0]) + _S2 * ord(team[1]) + ord(team[len(team) // 2]) + ord(team[-1]) + len(team)) % _SIZE\n')
+        f.write('    if _KEYS[i] == team:\n')
+        f.write('        return _ZIPS[i]\n')
+        f.write("    return ''\n")
+
+    print(f"Generated {output_file}: {len(keys)} teams, table size {size}, salts ({s1}, {s2})")
+
+def main():
+    """Main function to build the perfect-hash lookup module."""
+    parser = argparse.ArgumentParser(description='Generate a perfect-hash team-zipcode lookup module')
+    parser.add_argument('--zipcode-file', type=str,
+                       default='dev_data/nfl_teams_stadium_zip_only_5digit_text.csv',
+                       help='Path to team-zipcode mapping file (default: dev_data/nfl_teams_stadium_zip_only_5digit_text.csv)')
+    parser.add_argument('--output', type=str, default='team_zipcode_phf.py',
+                       help='Path of the generated module (default: team_zipcode_phf.py)')
+
+    args = parser.parse_args()
+
+    mapping = load_mapping(args.zipcode_file)
+    generate_module(mapping, args.output, args.zipcode_file)
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,15 @@ Fetches NFL game statistics from Pro Football Reference
 Extracts: date, teams (home/away), scores, rushing yards, passing yards
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import asyncio
+import httpx
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+from soupsieve import compile as css_compile
+import csv
+import json
 import time
-from datetime import datetime
+import hashlib
 import re
 import argparse
 import os
@@ -26,54 +30,340 @@ CRAWL_DELAY = 2
 # Maximum retries for 429 errors
 MAX_RETRIES = 3
 
+# Maximum boxscore fetches in flight at once
+MAX_CONCURRENT_FETCHES = 4
+
+# On-disk cache of fetched HTML; reruns (e.g. while adding stat columns)
+# collapse to pure local parse time instead of refetching every page
+CACHE_DIR = '.cache/nfl_crawler'
+CACHE_EXPIRY = 7 * 86400  # seconds
+USE_CACHE = True
+
+def _cache_path(url):
+    """Map a URL to its cache file path."""
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + '.html')
+
+def cache_get(url):
+    """
+    Look up a URL in the on-disk cache.
+
+    Args:
+        url: URL the content was fetched from
+
+    Returns:
+        Cached body bytes, or None on miss/expiry/cache disabled
+    """
+    if not USE_CACHE:
+        return None
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_EXPIRY:
+            with open(path, 'rb') as f:
+                return f.read()
+    except OSError:
+        pass
+    return None
+
+def cache_put(url, content, headers=None):
+    """
+    Store fetched content in the on-disk cache (atomically, via a temp file).
+
+    When the response carried ETag/Last-Modified validators, they are kept
+    in a .meta sidecar so an expired entry can later be revalidated with a
+    conditional GET instead of re-downloaded.
+
+    Args:
+        url: URL the content was fetched from
+        content: Response body bytes
+        headers: Response headers to pull cache validators from
+    """
+    if not USE_CACHE:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(url)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+    validators = {}
+    if headers:
+        if headers.get('ETag'):
+            validators['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            validators['last_modified'] = headers['Last-Modified']
+    if validators:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(validators, f)
+        os.replace(temp_path, path + '.meta')
+
+def cache_validators(url):
+    """
+    Load a stale cache entry and the conditional-GET headers for it.
+
+    Used when the entry has passed its expiry: the stored body plus
+    If-None-Match/If-Modified-Since let the server answer 304 with no
+    body when the page is unchanged.
+
+    Args:
+        url: URL the content was fetched from
+
+    Returns:
+        Tuple of (cached body bytes, conditional header dict); (None, {})
+        when there is no reusable entry
+    """
+    if not USE_CACHE:
+        return None, {}
+    try:
+        with open(_cache_path(url) + '.meta', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(_cache_path(url), 'rb') as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, {}
+
+    headers = {}
+    if 'etag' in meta:
+        headers['If-None-Match'] = meta['etag']
+    if 'last_modified' in meta:
+        headers['If-Modified-Since'] = meta['last_modified']
+    if not headers:
+        return None, {}
+    return body, headers
+
+class TokenBucket:
+    """
+    Asyncio token bucket bounding the cumulative request rate.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``;
+    acquire() waits for a token, so any number of concurrent tasks still
+    respect one shared per-host rate ceiling instead of each sleeping a
+    fixed delay (which would serialize them again).
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+# Shared rate limiter for every request in a run; main_async rebuilds it
+# inside the running event loop (asyncio primitives bind to the first
+# loop that uses them, so a prior run's bucket can't be reused)
+LIMITER = TokenBucket(rate=1 / CRAWL_DELAY)
+
+# Team abbreviation to name mapping (built once, not per parsed game)
+TEAM_ABBR_MAP = {
+    'ari': 'Arizona Cardinals', 'atl': 'Atlanta Falcons', 'bal': 'Baltimore Ravens',
+    'buf': 'Buffalo Bills', 'car': 'Carolina Panthers', 'chi': 'Chicago Bears',
+    'cin': 'Cincinnati Bengals', 'cle': 'Cleveland Browns', 'dal': 'Dallas Cowboys',
+    'den': 'Denver Broncos', 'det': 'Detroit Lions', 'gb': 'Green Bay Packers',
+    'hou': 'Houston Texans', 'ind': 'Indianapolis Colts', 'jax': 'Jacksonville Jaguars',
+    'kan': 'Kansas City Chiefs', 'kc': 'Kansas City Chiefs', 'lv': 'Las Vegas Raiders',
+    'lac': 'Los Angeles Chargers', 'lar': 'Los Angeles Rams', 'mia': 'Miami Dolphins',
+    'min': 'Minnesota Vikings', 'ne': 'New England Patriots', 'no': 'New Orleans Saints',
+    'nyg': 'New York Giants', 'nyj': 'New York Jets', 'phi': 'Philadelphia Eagles',
+    'pit': 'Pittsburgh Steelers', 'sf': 'San Francisco 49ers', 'sea': 'Seattle Seahawks',
+    'tb': 'Tampa Bay Buccaneers', 'ten': 'Tennessee Titans', 'was': 'Washington Football Team',
+    'rav': 'Baltimore Ravens', 'jag': 'Jacksonville Jaguars'
+}
+
+# Alternate abbreviations PFR uses for the same franchise, folded to one
+# canonical id so boxscore-URL abbreviations and team names compare equal
+_ABBR_ALIASES = {'kan': 'kc', 'rav': 'bal', 'jag': 'jax'}
+
+# Franchise renames/relocations across seasons; PFR renders whichever
+# name was in use that year, so every variant must resolve to the same
+# canonical id or home/away assignment breaks for those teams
+_TEAM_NAME_ALIASES = {
+    'Washington Commanders': 'was',
+    'Washington Redskins': 'was',
+    'Oakland Raiders': 'lv',
+    'San Diego Chargers': 'lac',
+    'St. Louis Rams': 'lar',
+}
+
+# Reverse map: full team name -> canonical abbreviation
+TEAM_NAME_TO_ID = {name: _ABBR_ALIASES.get(abbr, abbr) for abbr, name in TEAM_ABBR_MAP.items()}
+TEAM_NAME_TO_ID.update(_TEAM_NAME_ALIASES)
+
+# Exact (lowercased) headers of the stat rows we read from the team
+# stats table, so the row loop dispatches on one set lookup instead of
+# re-testing overlapping substring patterns per row
+_WANTED_STATS = {'rush-yds-tds', 'net pass yds', 'net pass yards', 'pass yds'}
+
+def _cell_text(cell):
+    """
+    Extract stripped text from a table cell.
+
+    Uses .string (no tree recursion) when the cell has a single child and
+    falls back to get_text() otherwise.
+
+    Args:
+        cell: BeautifulSoup th/td element
+
+    Returns:
+        The cell's text content, stripped
+    """
+    text = cell.string
+    if text is None:
+        text = cell.get_text()
+    return text.strip()
+
+# Boxscore pages are ~300KB but only the team-stats subtree matters;
+# straining makes the parser skip everything else
+_BOXSCORE_STRAINER = SoupStrainer(id='div_team_stats')
+
+# Game-summary selectors, compiled once; matching runs inside soupsieve
+# instead of calling a Python predicate on every tag of the week page
+_SUMMARY_SEL = css_compile('div.game_summary.expanded.nohover')
+_SUMMARY_SEL_ANY = css_compile('div.game_summary')
+
+# Process pool for HTML parsing, created on first use. Parsing holds the
+# GIL, so running it in workers lets completed boxscores parse while the
+# event loop keeps other fetches in flight
+_EXECUTOR = None
+
+def _parse_executor():
+    """Create the shared parsing pool on first use and return it."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _EXECUTOR
+
+# Month lookups for the fast date parser; PFR renders dates like
+# "Sep 28, 2020" (occasionally with the full month name)
+_MONTHS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
+    'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12',
+    'January': '01', 'February': '02', 'March': '03', 'April': '04',
+    'June': '06', 'July': '07', 'August': '08', 'September': '09',
+    'October': '10', 'November': '11', 'December': '12'
+}
+
+def _parse_pfr_date(date_text):
+    """
+    Parse a PFR date like 'Sep 28, 2020' into '%Y-%m-%d'.
+
+    A split plus dict lookup replaces datetime.strptime, which re-walks
+    its format string on every call.
+
+    Args:
+        date_text: Date text from the game summary table
+
+    Returns:
+        Formatted date string, or None if the text does not match
+    """
+    parts = date_text.split()
+    if len(parts) != 3:
+        return None
+    month = _MONTHS.get(parts[0])
+    day = parts[1].rstrip(',')
+    year = parts[2]
+    if not month or not day.isdigit() or not year.isdigit():
+        return None
+    return f"{year}-{month}-{day.zfill(2)}"
+
+# Patterns compiled once instead of per parsed game
+_RE_TEAMS = re.compile(r'/teams/')
+_RE_GAMELINK = re.compile(r'gamelink')
+_RE_BOXSCORE = re.compile(r'/boxscores/')
+_RE_BOX_URL = re.compile(r'(\d{8})([a-z]{2,3})\.htm')
+
+# Parsed robots.txt, fetched once per process (populated lazily)
+_ROBOTS = None
+
+def _robots():
+    """
+    Fetch and parse robots.txt on first use, then reuse the parsed result.
+
+    robots.txt is a static file, so re-fetching it for the week page and
+    again for every boxscore URL is pure wasted round-trips.
+
+    Returns:
+        The shared RobotFileParser instance
+    """
+    global _ROBOTS
+    if _ROBOTS is None:
+        rp = RobotFileParser()
+        rp.set_url(f"{PFR_BASE_URL}/robots.txt")
+        rp.read()
+        _ROBOTS = rp
+    return _ROBOTS
+
 def check_robots_txt(url_path):
     """
     Check if a URL path is allowed by robots.txt.
-    
+
     Args:
         url_path: Path to check (e.g., '/years/2020/week_1.htm')
-    
+
     Returns:
         True if allowed, False otherwise
     """
     try:
-        rp = RobotFileParser()
-        rp.set_url(f"{PFR_BASE_URL}/robots.txt")
-        rp.read()
-        return rp.can_fetch(USER_AGENT, f"{PFR_BASE_URL}{url_path}")
+        return _robots().can_fetch(USER_AGENT, f"{PFR_BASE_URL}{url_path}")
     except Exception as e:
         print(f"  Warning: Could not check robots.txt: {e}")
         # If we can't check, be conservative and allow (but still be respectful)
         return True
 
-def fetch_with_retry(url, timeout=15, max_retries=MAX_RETRIES, context=""):
+async def fetch_with_retry_async(session, url, timeout=15, max_retries=MAX_RETRIES, context=""):
     """
     Fetch a URL with retry logic for 429 (Too Many Requests) errors.
-    
+
     Args:
+        session: httpx.AsyncClient to fetch with
         url: URL to fetch
         timeout: Request timeout in seconds
         max_retries: Maximum number of retries
         context: Context string for logging (e.g., "week page" or "boxscore")
-    
+
     Returns:
-        Response object or None if all retries failed
+        Response body bytes or None if all retries failed
     """
-    headers = {'User-Agent': USER_AGENT}
-    
+    # Cache hits skip the network and the rate limiter entirely
+    cached = cache_get(url)
+    if cached is not None:
+        return cached
+
+    # An expired entry with validators is worth a conditional GET: a 304
+    # answer reuses the stored body without transferring the page again
+    stale_body, cond_headers = cache_validators(url)
+
     for attempt in range(max_retries + 1):
+        # Rate limit every attempt, retries included
+        await LIMITER.acquire()
         try:
-            response = requests.get(url, timeout=timeout, headers=headers)
-            
+            response = await session.get(url, timeout=timeout, headers=cond_headers or None)
+
+            if response.status_code == 304 and stale_body is not None:
+                # Unchanged on the server; restart the expiry clock
+                os.utime(_cache_path(url), None)
+                return stale_body
+
             if response.status_code == 429:
                 # Extract Retry-After header
                 retry_after = response.headers.get('Retry-After')
-                
+
                 print(f"  ERROR 429: Too Many Requests when fetching {context}")
                 print(f"  Response Status: {response.status_code}")
                 print(f"  Response Headers: {dict(response.headers)}")
                 print(f"  Response Text (first 500 chars): {response.text[:500]}")
-                
+
                 if retry_after:
                     try:
                         wait_time = int(retry_after)
@@ -85,31 +375,33 @@ def fetch_with_retry(url, timeout=15, max_retries=MAX_RETRIES, context=""):
                 else:
                     print(f"  No Retry-After header found, using exponential backoff")
                     wait_time = CRAWL_DELAY * (2 ** attempt)  # Exponential backoff: 2, 4, 8 seconds
-                
+
                 if attempt < max_retries:
                     print(f"  Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                     continue
                 else:
                     print(f"  Max retries ({max_retries}) reached. Giving up.")
                     return None
-            
+
             # For other status codes, raise an exception to be handled by caller
             response.raise_for_status()
-            return response
-            
-        except requests.exceptions.RequestException as e:
+            content = response.content
+            cache_put(url, content, response.headers)
+            return content
+
+        except httpx.HTTPError as e:
             if attempt < max_retries and '429' in str(e):
                 # Handle 429 in exception message
                 print(f"  ERROR 429: Too Many Requests (in exception)")
                 wait_time = CRAWL_DELAY * (2 ** attempt)
                 print(f"  Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}...")
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
                 continue
             else:
                 # Re-raise other exceptions
                 raise
-    
+
     return None
 
 def get_week_url(year, week):
@@ -133,12 +425,15 @@ def parse_game_summary(game_summary_div, year=2020):
     """
     Parse a single game summary div from Pro Football Reference.
     
+    This is pure HTML parsing with no network I/O; the boxscore stats are
+    fetched separately by fetch_game_stats.
+
     Args:
         game_summary_div: BeautifulSoup element with class "game_summary expanded nohover"
         year: Season year
-    
+
     Returns:
-        Dictionary with game data or None if invalid
+        Tuple of (game data dictionary, boxscore URL or None), or None if invalid
     """
     try:
         # Find the teams table
@@ -150,18 +445,8 @@ def parse_game_summary(game_summary_div, year=2020):
         date_str = None
         date_row = teams_table.find('tr', class_='date')
         if date_row:
-            date_text = date_row.get_text().strip()
             # Parse date like "Sep 28, 2020"
-            try:
-                date_obj = datetime.strptime(date_text, '%b %d, %Y')
-                date_str = date_obj.strftime('%Y-%m-%d')
-            except ValueError:
-                # Try alternative format
-                try:
-                    date_obj = datetime.strptime(date_text, '%B %d, %Y')
-                    date_str = date_obj.strftime('%Y-%m-%d')
-                except ValueError:
-                    pass
+            date_str = _parse_pfr_date(date_row.get_text().strip())
         
         # Extract winner and loser teams
         winner_row = teams_table.find('tr', class_='winner')
@@ -171,7 +456,7 @@ def parse_game_summary(game_summary_div, year=2020):
             return None
         
         # Get winner team name and score
-        winner_team_link = winner_row.find('a', href=re.compile(r'/teams/'))
+        winner_team_link = winner_row.find('a', href=_RE_TEAMS)
         winner_score_cell = winner_row.find('td', class_='right')
         
         if not winner_team_link or not winner_score_cell:
@@ -181,7 +466,7 @@ def parse_game_summary(game_summary_div, year=2020):
         winner_score = int(winner_score_cell.get_text().strip())
         
         # Get loser team name and score
-        loser_team_link = loser_row.find('a', href=re.compile(r'/teams/'))
+        loser_team_link = loser_row.find('a', href=_RE_TEAMS)
         loser_score_cell = loser_row.find('td', class_='right')
         
         if not loser_team_link or not loser_score_cell:
@@ -194,33 +479,17 @@ def parse_game_summary(game_summary_div, year=2020):
         gamelink_td = winner_row.find('td', class_='right gamelink')
         if not gamelink_td:
             # Try alternative: look for any gamelink td
-            gamelink_td = teams_table.find('td', class_=re.compile(r'gamelink'))
+            gamelink_td = teams_table.find('td', class_=_RE_GAMELINK)
         
         home_team = None
         away_team = None
         home_score = None
         away_score = None
         game_url = None
-        
-        # Team abbreviation to name mapping
-        team_abbr_map = {
-            'ari': 'Arizona Cardinals', 'atl': 'Atlanta Falcons', 'bal': 'Baltimore Ravens',
-            'buf': 'Buffalo Bills', 'car': 'Carolina Panthers', 'chi': 'Chicago Bears',
-            'cin': 'Cincinnati Bengals', 'cle': 'Cleveland Browns', 'dal': 'Dallas Cowboys',
-            'den': 'Denver Broncos', 'det': 'Detroit Lions', 'gb': 'Green Bay Packers',
-            'hou': 'Houston Texans', 'ind': 'Indianapolis Colts', 'jax': 'Jacksonville Jaguars',
-            'kan': 'Kansas City Chiefs', 'kc': 'Kansas City Chiefs', 'lv': 'Las Vegas Raiders',
-            'lac': 'Los Angeles Chargers', 'lar': 'Los Angeles Rams', 'mia': 'Miami Dolphins',
-            'min': 'Minnesota Vikings', 'ne': 'New England Patriots', 'no': 'New Orleans Saints',
-            'nyg': 'New York Giants', 'nyj': 'New York Jets', 'phi': 'Philadelphia Eagles',
-            'pit': 'Pittsburgh Steelers', 'sf': 'San Francisco 49ers', 'sea': 'Seattle Seahawks',
-            'tb': 'Tampa Bay Buccaneers', 'ten': 'Tennessee Titans', 'was': 'Washington Football Team',
-            'rav': 'Baltimore Ravens', 'jag': 'Jacksonville Jaguars'
-        }
-        
+
         # Extract boxscore URL from gamelink td
         if gamelink_td:
-            boxscore_link = gamelink_td.find('a', href=re.compile(r'/boxscores/'))
+            boxscore_link = gamelink_td.find('a', href=_RE_BOXSCORE)
             if boxscore_link and boxscore_link.get('href'):
                 # Construct full URL
                 href = boxscore_link.get('href')
@@ -229,35 +498,20 @@ def parse_game_summary(game_summary_div, year=2020):
                 else:
                     game_url = 'https://www.pro-football-reference.com/' + href
                 
-                # Extract home team abbreviation from URL
-                url_match = re.search(r'(\d{8})([a-z]{2,3})\.htm', href)
+                # Extract home team abbreviation from URL and compare
+                # canonical ids; the winner is home iff the URL's
+                # abbreviation maps to the winner
+                url_match = _RE_BOX_URL.search(href)
                 if url_match:
-                    home_team_abbr = url_match.group(2)
-                    home_team_name = team_abbr_map.get(home_team_abbr)
-                    
-                    # Match home team with winner or loser
-                    if home_team_name == winner_team:
-                        home_team = winner_team
-                        home_score = winner_score
-                        away_team = loser_team
-                        away_score = loser_score
-                    elif home_team_name == loser_team:
-                        home_team = loser_team
-                        home_score = loser_score
-                        away_team = winner_team
-                        away_score = winner_score
+                    abbr = url_match.group(2)
+                    home_id = _ABBR_ALIASES.get(abbr, abbr)
+
+                    if home_id == TEAM_NAME_TO_ID.get(winner_team):
+                        home_team, home_score = winner_team, winner_score
+                        away_team, away_score = loser_team, loser_score
                     else:
-                        # Try partial matching
-                        if home_team_name and any(word.lower() in winner_team.lower() for word in home_team_name.split() if len(word) > 3):
-                            home_team = winner_team
-                            home_score = winner_score
-                            away_team = loser_team
-                            away_score = loser_score
-                        else:
-                            home_team = loser_team
-                            home_score = loser_score
-                            away_team = winner_team
-                            away_score = winner_score
+                        home_team, home_score = loser_team, loser_score
+                        away_team, away_score = winner_team, winner_score
         
         # Fallback if we couldn't determine home/away
         if not home_team or not away_team:
@@ -267,155 +521,239 @@ def parse_game_summary(game_summary_div, year=2020):
             away_team = loser_team
             away_score = loser_score
         
-        # Get rushing and passing yards from boxscore page
-        # Find div with id="div_team_stats" and extract Rush-Yds-TDs and Net Pass Yards
-        home_rushing = None
-        away_rushing = None
-        home_passing = None
-        away_passing = None
-        
-        if game_url:
-            try:
-                # Check robots.txt for boxscore page
-                boxscore_path = game_url.replace(PFR_BASE_URL, '')
-                if not check_robots_txt(boxscore_path):
-                    print(f"    Warning: {boxscore_path} is disallowed by robots.txt, skipping stats...")
-                else:
-                    time.sleep(CRAWL_DELAY)  # Be respectful to the server
-                    game_response = fetch_with_retry(game_url, timeout=10, context=f"boxscore ({home_team} vs {away_team})")
-                    if game_response is None:
-                        print(f"    Failed to fetch boxscore after retries, skipping stats...")
-                    else:
-                        game_soup = BeautifulSoup(game_response.content, 'html.parser')
-                        
-                        # Find div with id="div_team_stats"
-                        team_stats_div = game_soup.find('div', {'id': 'div_team_stats'})
-                        
-                        if team_stats_div:
-                            # Find the table inside this div
-                            stats_table = team_stats_div.find('table')
-                            
-                            if stats_table:
-                                rows = stats_table.find_all('tr')
-                                for row in rows:
-                                    header = row.find('th')
-                                    if header:
-                                        stat_name = header.get_text().strip().lower()
-                                        cells = row.find_all('td')
-                                        
-                                        if len(cells) >= 2:
-                                            try:
-                                                # Look for "Rush-Yds-TDs" - extract the yards part
-                                                if 'rush' in stat_name and ('yds' in stat_name or 'tds' in stat_name):
-                                                    # The format is usually like "Rush-Yds-TDs" and values are like "25-120-1"
-                                                    # We need to extract the middle number (yards)
-                                                    away_value = cells[0].get_text().strip()
-                                                    home_value = cells[1].get_text().strip()
-                                                    
-                                                    # Parse format like "25-120-1" to get yards (middle number)
-                                                    away_parts = away_value.split('-')
-                                                    home_parts = home_value.split('-')
-                                                    
-                                                    if len(away_parts) >= 2 and len(home_parts) >= 2:
-                                                        away_rushing = int(away_parts[1].replace(',', ''))
-                                                        home_rushing = int(home_parts[1].replace(',', ''))
-                                                
-                                                # Look for "Net Pass Yards" or "Pass Yds"
-                                                elif 'net' in stat_name and 'pass' in stat_name and 'yds' in stat_name:
-                                                    away_passing = int(cells[0].get_text().strip().replace(',', ''))
-                                                    home_passing = int(cells[1].get_text().strip().replace(',', ''))
-                                                elif 'pass' in stat_name and 'yds' in stat_name and 'net' not in stat_name:
-                                                    # Sometimes it's just "Pass Yds" without "Net"
-                                                    away_passing = int(cells[0].get_text().strip().replace(',', ''))
-                                                    home_passing = int(cells[1].get_text().strip().replace(',', ''))
-                                            except (ValueError, IndexError, AttributeError) as e:
-                                                pass
-                
-            except Exception as e:
-                print(f"    Warning: Could not fetch stats from {game_url}: {e}")
-        
         # Validate we have minimum required data
         if not date_str or not home_team or not away_team or home_score is None or away_score is None:
             return None
-        
+
         return {
             'Date': date_str,
             'Home Team': home_team,
             'Away Team': away_team,
             'Home Score': home_score,
             'Away Score': away_score,
-            'Home Rushing Yards': home_rushing,
-            'Away Rushing Yards': away_rushing,
-            'Home Passing Yards': home_passing,
-            'Away Passing Yards': away_passing
-        }
-    
+            'Home Rushing Yards': None,
+            'Away Rushing Yards': None,
+            'Home Passing Yards': None,
+            'Away Passing Yards': None
+        }, game_url
+
     except Exception as e:
         print(f"  Error parsing game summary: {e}")
         return None
 
-def fetch_week_games(week_url, year=2020):
+def _parse_week_summaries(content, year):
+    """
+    Parse a week page into its game summaries.
+
+    A pure function of the page bytes (input and output both pickle
+    cleanly), so it can run in a worker process off the event loop.
+
+    Args:
+        content: Raw HTML bytes of the week page
+        year: Season year
+
+    Returns:
+        Tuple of (number of summary divs found, list of
+        (game data dictionary, boxscore URL) pairs)
+    """
+    soup = BeautifulSoup(content, 'lxml')
+
+    # Find all game summary divs with class "game_summary expanded nohover",
+    # falling back to any div with the game_summary class
+    game_summaries = _SUMMARY_SEL.select(soup) or _SUMMARY_SEL_ANY.select(soup)
+
+    parsed = [parse_game_summary(summary_div, year) for summary_div in game_summaries]
+    return len(game_summaries), [p for p in parsed if p]
+
+def parse_team_stats(content):
+    """
+    Parse rushing and passing yards from a boxscore page.
+
+    Finds the div with id="div_team_stats" and extracts the yards from the
+    Rush-Yds-TDs and Net Pass Yards rows (away team in the first cell, home
+    team in the second).
+
+    Args:
+        content: Raw HTML bytes of the boxscore page
+
+    Returns:
+        Tuple of (home_rushing, away_rushing, home_passing, away_passing),
+        with None for any stat that could not be parsed
+    """
+    home_rushing = None
+    away_rushing = None
+    home_passing = None
+    away_passing = None
+
+    # lxml is a C parser, several times faster than html.parser on these pages
+    game_soup = BeautifulSoup(content, 'lxml', parse_only=_BOXSCORE_STRAINER)
+
+    # Find div with id="div_team_stats"
+    team_stats_div = game_soup.find('div', {'id': 'div_team_stats'})
+
+    if not team_stats_div:
+        # PFR serves some tables inside HTML comments; strip the comment
+        # markers and parse again
+        content = content.replace(b'<!--', b'').replace(b'-->', b'')
+        game_soup = BeautifulSoup(content, 'lxml', parse_only=_BOXSCORE_STRAINER)
+        team_stats_div = game_soup.find('div', {'id': 'div_team_stats'})
+
+    if team_stats_div:
+        # Find the table inside this div
+        stats_table = team_stats_div.find('table')
+
+        if stats_table:
+            for row in stats_table.find_all('tr'):
+                header = row.find('th')
+                if not header:
+                    continue
+
+                # Dispatch on the exact header; skip rows we don't read
+                # before touching their cells at all
+                stat_name = _cell_text(header).lower()
+                if stat_name not in _WANTED_STATS:
+                    continue
+
+                # Boxscore rows have flat children (away cell, home cell)
+                cells = row.find_all('td', recursive=False)
+                if len(cells) < 2:
+                    continue
+
+                try:
+                    away_value = _cell_text(cells[0])
+                    home_value = _cell_text(cells[1])
+
+                    if stat_name == 'rush-yds-tds':
+                        # Values look like "25-120-1"; the yards are the
+                        # middle number
+                        away_parts = away_value.split('-')
+                        home_parts = home_value.split('-')
+
+                        if len(away_parts) >= 2 and len(home_parts) >= 2:
+                            away_rushing = int(away_parts[1].replace(',', ''))
+                            home_rushing = int(home_parts[1].replace(',', ''))
+                    else:
+                        # One of the pass-yards variants
+                        away_passing = int(away_value.replace(',', ''))
+                        home_passing = int(home_value.replace(',', ''))
+                except (ValueError, IndexError, AttributeError):
+                    pass
+
+    return home_rushing, away_rushing, home_passing, away_passing
+
+async def fetch_game_stats(session, semaphore, game_data, game_url):
+    """
+    Fetch a boxscore page and fill in the rushing/passing stats for a game.
+
+    The semaphore bounds how many boxscore fetches run at once so the
+    per-host rate stays respectful even with games fetched concurrently.
+
+    Args:
+        session: httpx.AsyncClient to fetch with
+        semaphore: asyncio.Semaphore limiting concurrent fetches
+        game_data: Game dictionary from parse_game_summary (updated in place)
+        game_url: Boxscore URL, or None to skip stats
+
+    Returns:
+        The game dictionary, with stats filled in when available
+    """
+    if not game_url:
+        return game_data
+
+    home_team = game_data['Home Team']
+    away_team = game_data['Away Team']
+
+    try:
+        # Check robots.txt for boxscore page
+        boxscore_path = game_url.replace(PFR_BASE_URL, '')
+        if not check_robots_txt(boxscore_path):
+            print(f"    Warning: {boxscore_path} is disallowed by robots.txt, skipping stats...")
+            return game_data
+
+        # The shared token bucket paces the actual request, so no fixed
+        # sleep is needed here
+        async with semaphore:
+            content = await fetch_with_retry_async(
+                session, game_url, timeout=10,
+                context=f"boxscore ({home_team} vs {away_team})")
+
+        if content is None:
+            print(f"    Failed to fetch boxscore after retries, skipping stats...")
+            return game_data
+
+        # Parse in a worker process so the event loop stays free for the
+        # other in-flight fetches (content bytes and the result tuple are
+        # both picklable)
+        loop = asyncio.get_running_loop()
+        home_rushing, away_rushing, home_passing, away_passing = \
+            await loop.run_in_executor(_parse_executor(), parse_team_stats, content)
+        game_data['Home Rushing Yards'] = home_rushing
+        game_data['Away Rushing Yards'] = away_rushing
+        game_data['Home Passing Yards'] = home_passing
+        game_data['Away Passing Yards'] = away_passing
+
+    except Exception as e:
+        print(f"    Warning: Could not fetch stats from {game_url}: {e}")
+
+    return game_data
+
+async def fetch_week_games(session, week_url, year=2020, fetch_stats=True):
     """
     Fetch all games from a specific week.
-    
+
+    The week page is fetched first, then the boxscore pages for all of its
+    games are fetched concurrently (bounded by MAX_CONCURRENT_FETCHES)
+    instead of one at a time.
+
     Args:
+        session: httpx.AsyncClient to fetch with
         week_url: URL of the week page
         year: Season year
-    
+        fetch_stats: Whether to fetch boxscores for the rushing/passing
+            columns; False turns a week crawl into a single request
+
     Returns:
         List of game dictionaries
     """
     games = []
-    
+
     try:
         # Check robots.txt compliance
         url_path = week_url.replace(PFR_BASE_URL, '')
         if not check_robots_txt(url_path):
             print(f"  Warning: {url_path} is disallowed by robots.txt, skipping...")
             return games
-        
+
         print(f"Fetching: {week_url}")
-        response = fetch_with_retry(week_url, timeout=15, context="week page")
-        if response is None:
+        content = await fetch_with_retry_async(session, week_url, timeout=15, context="week page")
+        if content is None:
             print(f"  Failed to fetch week page after retries")
             return games
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find all game summary divs with class "game_summary expanded nohover"
-        # Handle both string and list class attributes
-        def has_game_summary_class(tag):
-            if tag.name != 'div':
-                return False
-            classes = tag.get('class', [])
-            if isinstance(classes, str):
-                classes = classes.split()
-            return 'game_summary' in classes and 'expanded' in classes and 'nohover' in classes
-        
-        game_summaries = soup.find_all(has_game_summary_class)
-        
-        if not game_summaries:
-            # Try finding by class string match
-            game_summaries = soup.find_all('div', class_='game_summary expanded nohover')
-        
-        if not game_summaries:
-            # Try finding any div with game_summary class
-            game_summaries = soup.find_all('div', class_=re.compile(r'game_summary'))
-        
-        if not game_summaries:
+
+        # Parse the week page in a worker process, then fetch the
+        # boxscores concurrently under a shared semaphore
+        loop = asyncio.get_running_loop()
+        found, parsed = await loop.run_in_executor(
+            _parse_executor(), _parse_week_summaries, content, year)
+
+        if not found:
             print(f"  No game summaries found for {week_url}")
             return games
-        
-        print(f"  Found {len(game_summaries)} game summaries")
-        
-        for summary_div in game_summaries:
-            game_data = parse_game_summary(summary_div, year)
-            if game_data:
-                games.append(game_data)
-        
+
+        print(f"  Found {found} game summaries")
+
+        if fetch_stats:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+            games = list(await asyncio.gather(
+                *(fetch_game_stats(session, semaphore, game_data, game_url)
+                  for game_data, game_url in parsed)))
+        else:
+            # Summary fields only; leave the yard columns empty
+            games = [game_data for game_data, game_url in parsed]
+
         print(f"  Successfully parsed {len(games)} games")
-        
-    except requests.exceptions.RequestException as e:
+
+    except httpx.HTTPError as e:
         print(f"  Error fetching {week_url}: {e}")
     except Exception as e:
         print(f"  Error processing {week_url}: {e}")
@@ -424,9 +762,52 @@ def fetch_week_games(week_url, year=2020):
     
     return games
 
-def main():
+def parse_weeks(week_spec):
     """
-    Main function to fetch NFL game stats and save to CSV.
+    Parse a --week value into a list of weeks.
+
+    Accepts a single week ('3'), a playoff round ('wild-card'), a numeric
+    range ('1-18'), and comma-separated combinations ('1-4,7,super-bowl').
+
+    Args:
+        week_spec: The raw --week argument string
+
+    Returns:
+        List of weeks as ints and/or playoff round strings
+    """
+    weeks = []
+    for part in week_spec.split(','):
+        part = part.strip()
+        # Only digit-digit is a range; playoff names also contain '-'
+        if re.fullmatch(r'\d+-\d+', part):
+            start, end = part.split('-')
+            weeks.extend(range(int(start), int(end) + 1))
+        elif part.isdigit():
+            weeks.append(int(part))
+        elif part:
+            weeks.append(part)
+    return weeks
+
+async def crawl_week(session, year, week, fetch_stats=True):
+    """
+    Fetch all games for one week of a season.
+
+    Args:
+        session: httpx.AsyncClient to fetch with
+        year: Season year
+        week: Week number or playoff round name
+        fetch_stats: Whether to fetch boxscores for the yard columns
+
+    Returns:
+        List of game dictionaries
+    """
+    week_url = get_week_url(year, week)
+    print(f"Fetching games from Week {week}...")
+    return await fetch_week_games(session, week_url, year, fetch_stats)
+
+async def main_async():
+    """
+    Main coroutine to fetch NFL game stats and save to CSV.
     """
     parser = argparse.ArgumentParser(
         description='NFL Game Stats Crawler - Fetches game statistics from Pro Football Reference',
@@ -435,6 +816,7 @@ def main():
 Examples:
   python nfl_crawler.py --year 2020 --week 1
   python nfl_crawler.py --year 2020 --week 10
+  python nfl_crawler.py --year 2020 --week 1-18
   python nfl_crawler.py --year 2020 --week wild-card
   python nfl_crawler.py --year 2020 --week super-bowl
         """
@@ -449,81 +831,140 @@ Examples:
         '--week',
         type=str,
         required=True,
-        help='Week number (1-18) or playoff round (wild-card, divisional, conference, super-bowl)'
+        help='Week number (1-18), a range (1-18), a playoff round (wild-card, divisional, '
+             'conference, super-bowl), or a comma-separated combination'
     )
-    
+    parser.add_argument(
+        '--rps',
+        type=float,
+        default=None,
+        help=f'Maximum requests per second across all fetches (default: {1 / CRAWL_DELAY})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore the on-disk HTML cache and refetch every page'
+    )
+    parser.add_argument(
+        '--stats',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Fetch boxscores for rushing/passing yards; --no-stats crawls '
+             'only the week page (1 request instead of ~17)'
+    )
+    parser.add_argument(
+        '--pretty-print',
+        action='store_true',
+        help='Render the sample-data table with pandas (optional dependency)'
+    )
+
     args = parser.parse_args()
+
+    # Always rebuild the bucket here so it binds to this run's event
+    # loop; reusing one from a previous asyncio.run would raise
+    global LIMITER
+    LIMITER = TokenBucket(rate=args.rps if args.rps else 1 / CRAWL_DELAY)
+
+    if args.no_cache:
+        global USE_CACHE
+        USE_CACHE = False
     
     year = args.year
-    week = args.week
-    
+    weeks = parse_weeks(args.week)
+
     # Validate week input
-    if week.isdigit():
-        week_num = int(week)
-        if week_num < 1 or week_num > 18:
-            print(f"Error: Week must be between 1 and 18, got {week_num}")
-            return
-    elif week not in ['wild-card', 'divisional', 'conference', 'super-bowl']:
-        print(f"Error: Invalid week '{week}'. Must be 1-18 or one of: wild-card, divisional, conference, super-bowl")
+    if not weeks:
+        print(f"Error: No weeks given in '{args.week}'")
         return
-    
+    for week in weeks:
+        if isinstance(week, int):
+            if week < 1 or week > 18:
+                print(f"Error: Week must be between 1 and 18, got {week}")
+                return
+        elif week not in ['wild-card', 'divisional', 'conference', 'super-bowl']:
+            print(f"Error: Invalid week '{week}'. Must be 1-18 or one of: wild-card, divisional, conference, super-bowl")
+            return
+
     print("=" * 70)
-    print(f"NFL Game Stats Crawler - {year} Season, Week {week}")
+    print(f"NFL Game Stats Crawler - {year} Season, Week {args.week}")
     print("=" * 70)
     print()
     print(f"User-Agent: {USER_AGENT}")
     print(f"Crawl Delay: {CRAWL_DELAY} seconds")
     print()
-    
+
     # Generate output filename with year and week
-    week_str = str(week).replace('-', '_')
+    week_str = args.week.replace('-', '_').replace(',', '_')
     output_file = f'dev_data/nfl_{year}_week_{week_str}_game_stats.csv'
     print(f"Output file: {output_file}")
     print()
-    
-    # Get week URL
-    week_url = get_week_url(year, week)
-    
-    # Fetch games from the specified week
-    print(f"Fetching games from Week {week}...")
-    games = fetch_week_games(week_url, year)
-    
+
+    # Fetch all requested weeks concurrently over one HTTP/2 client, so
+    # concurrent GETs to the same origin multiplex on a single TCP+TLS
+    # connection; the shared token bucket keeps the total request rate
+    # bounded regardless of how many weeks are in flight
+    limits = httpx.Limits(max_keepalive_connections=2, max_connections=8)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=15,
+                                 headers={'User-Agent': USER_AGENT},
+                                 follow_redirects=True) as session:
+        results = await asyncio.gather(
+            *(crawl_week(session, year, week, args.stats) for week in weeks))
+
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown()
+
+    games = [game for week_games in results for game in week_games]
+
     if not games:
         print("Error: No game data was retrieved.")
         return
     
-    # Create DataFrame
-    df = pd.DataFrame(games)
-    
-    # Sort by date
-    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-    df = df.sort_values('Date')
-    df['Date'] = df['Date'].dt.strftime('%Y-%m-%d')
-    
-    # Reorder columns
     column_order = ['Date', 'Home Team', 'Away Team', 'Home Score', 'Away Score',
-                   'Home Rushing Yards', 'Away Rushing Yards', 
+                   'Home Rushing Yards', 'Away Rushing Yards',
                    'Home Passing Yards', 'Away Passing Yards']
-    df = df[column_order]
-    
+
+    # Sort by date; %Y-%m-%d sorts correctly as plain strings (Timsort is
+    # stable, so same-day games keep their order)
+    games.sort(key=lambda game: game['Date'])
+
     # Create output directory if it doesn't exist
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
-    # Save to CSV
-    df.to_csv(output_file, index=False)
-    
+
+    # Save to CSV; writing ~16 rows doesn't need a DataFrame, and dropping
+    # pandas from the import path cuts cold start by a few hundred ms
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=column_order)
+        writer.writeheader()
+        writer.writerows(games)
+
     print()
     print("=" * 70)
-    print(f"Successfully saved {len(df)} games to {output_file}")
+    print(f"Successfully saved {len(games)} games to {output_file}")
     print("=" * 70)
     print()
     print("Sample data:")
-    print(df.head(10).to_string(index=False))
+    if args.pretty_print:
+        # pandas is only needed for the aligned table rendering
+        import pandas as pd
+        print(pd.DataFrame.from_records(games[:10], columns=column_order).to_string(index=False))
+    else:
+        for game in games[:10]:
+            print(f"  {game['Date']}  {game['Away Team']} {game['Away Score']}"
+                  f" @ {game['Home Team']} {game['Home Score']}")
     print()
     print(f"Data saved to: {output_file}")
     print()
-    print(f"Total games: {len(df)}")
-    print(f"Games with complete stats: {df[['Home Rushing Yards', 'Home Passing Yards']].notna().all(axis=1).sum()}")
+    print(f"Total games: {len(games)}")
+    complete_stats = sum(1 for game in games
+                         if game['Home Rushing Yards'] is not None
+                         and game['Home Passing Yards'] is not None)
+    print(f"Games with complete stats: {complete_stats}")
+
+def main():
+    """
+    Main function to fetch NFL game stats and save to CSV.
+    """
+    asyncio.run(main_async())
 
 if __name__ == "__main__":
     main()
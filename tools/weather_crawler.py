@@ -4,11 +4,18 @@ Reads NFL games CSV file and adds weather temperature and condition columns
 based on Date, Time, and zipcode for each game.
 """
 
-import csv
+import asyncio
+import functools
+import hashlib
+import httpx
+import json
+import orjson
 import os
+import pandas as pd
+import re
 import requests
 import time
-from datetime import datetime
+from requests.adapters import HTTPAdapter, Retry
 import argparse
 
 # OpenWeatherMap API endpoint for historical weather
@@ -16,6 +23,110 @@ import argparse
 # For free tier, we'll use current weather API as fallback
 OPENWEATHER_API_BASE = "https://api.openweathermap.org/data/2.5"
 
+# Maximum weather lookups in flight at once
+MAX_CONCURRENT_FETCHES = 8
+
+# Requests per second against the weather APIs; 2/s keeps a season file
+# comfortably inside the Visual Crossing free tier's daily quota
+REQUESTS_PER_SECOND = 2.0
+
+class TokenBucket:
+    """
+    Asyncio token bucket bounding the cumulative lookup rate.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``, so
+    concurrent tasks share one rate ceiling instead of each sleeping a
+    fixed per-row delay regardless of how many are actually in flight.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+# Dates in the games file are already in the YYYY-MM-DD form the APIs
+# expect, so they only need validating, not reformatting
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+def _restore_header(columns):
+    """
+    Undo pandas' read_csv header mangling for write-back.
+
+    pandas renames empty header cells to 'Unnamed: N' and deduplicated
+    repeats to 'Name.1'; the games file has both (the '@' marker column
+    has no name), so restore the original spellings before writing or an
+    in-place run would permanently rewrite the source header.
+
+    Args:
+        columns: DataFrame columns as parsed by read_csv
+
+    Returns:
+        List of column names as they appeared in the source file
+    """
+    return ['' if c.startswith('Unnamed') else re.sub(r'\.\d+$', '', c) for c in columns]
+
+# Shared session for the synchronous helpers so repeated calls reuse
+# pooled keep-alive connections instead of paying a TCP+TLS handshake
+# per request; transient failures retry with backoff at the adapter level
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_maxsize=MAX_CONCURRENT_FETCHES,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504])))
+
+# On-disk cache of resolved lookups, keyed on (provider, zipcode, date).
+# Weather for a past date never changes, so entries have no expiry and
+# re-runs skip the network entirely for rows they have already resolved.
+CACHE_DIR = '.cache/weather_crawler'
+USE_CACHE = True
+
+def _cache_path(provider: str, zipcode: str, date: str) -> str:
+    """Return the cache file path for a (provider, zipcode, date) lookup."""
+    key = hashlib.sha1(f"{provider}:{zipcode}:{date}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, key + '.json')
+
+def cache_get(provider: str, zipcode: str, date: str):
+    """Return a cached (temperature, condition) tuple, or None on a miss."""
+    if not USE_CACHE:
+        return None
+    path = _cache_path(provider, zipcode, date)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            temp, condition = json.load(f)
+        return temp, condition
+    except (OSError, ValueError):
+        return None
+
+def cache_put(provider: str, zipcode: str, date: str, temp, condition):
+    """Store a resolved (temperature, condition) lookup in the cache."""
+    if not USE_CACHE:
+        return
+    path = _cache_path(provider, zipcode, date)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temp file and rename so readers never see partial data
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump([temp, condition], f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Cache is best-effort; a failed write just means a refetch later
+        pass
+
 def get_weather_by_zipcode(zipcode: str, date: str, time_str: str, api_key: str = None):
     """
     Get weather data for a specific zipcode, date, and time.
@@ -40,43 +151,56 @@ def get_weather_by_zipcode(zipcode: str, date: str, time_str: str, api_key: str
     # For historical data, we need to use One Call API 3.0 with coordinates
     # Since we have zipcode, we'll first get coordinates, then get historical weather
     # However, One Call API 3.0 requires coordinates, not zipcode
-    
+
     # Alternative: Use Visual Crossing API (free tier available) or other service
     # For now, let's use a simpler approach with OpenWeatherMap current weather
     # and note that historical data may require a different API
-    
+
     try:
-        # First, get coordinates from zipcode using geocoding API
-        geo_url = f"{OPENWEATHER_API_BASE}/weather"
-        geo_params = {
-            'zip': f"{zipcode},US",
-            'appid': api_key
-        }
-        
-        # For historical data, we'll use OpenWeatherMap One Call API 3.0
-        # But it requires coordinates, so we need to:
-        # 1. Get coordinates from zipcode
-        # 2. Use One Call API 3.0 for historical data
-        
-        # For now, using a workaround: get current weather as placeholder
-        # In production, you'd want to use historical weather API
-        
-        response = requests.get(geo_url, params=geo_params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            temp_kelvin = data['main']['temp']
-            temp_f = (temp_kelvin - 273.15) * 9/5 + 32
-            condition = data['weather'][0]['main']
-            return round(temp_f, 1), condition
-        else:
-            print(f"Error fetching weather for zipcode {zipcode}: {response.status_code}")
-            return None, None
-            
+        return _fetch_owm_current(zipcode, api_key)
     except Exception as e:
         print(f"Error getting weather for zipcode {zipcode}: {e}")
         return None, None
 
+@functools.lru_cache(maxsize=None)
+def _fetch_owm_current(zipcode: str, api_key: str):
+    """
+    Fetch current weather for a zipcode from OpenWeatherMap, memoized for
+    the run. Many games share a stadium, so identical zipcodes hit the
+    API once instead of once per row.
+
+    Args:
+        zipcode: 5-digit US zipcode
+        api_key: OpenWeatherMap API key
+
+    Returns:
+        Tuple of (temperature_fahrenheit, condition) or (None, None) if error
+    """
+    # For historical data, we'll use OpenWeatherMap One Call API 3.0
+    # But it requires coordinates, so we need to:
+    # 1. Get coordinates from zipcode
+    # 2. Use One Call API 3.0 for historical data
+
+    # For now, using a workaround: get current weather as placeholder
+    # In production, you'd want to use historical weather API
+    geo_url = f"{OPENWEATHER_API_BASE}/weather"
+    geo_params = {
+        'zip': f"{zipcode},US",
+        'appid': api_key
+    }
+
+    response = _SESSION.get(geo_url, params=geo_params, timeout=10)
+
+    if response.status_code == 200:
+        data = orjson.loads(response.content)
+        temp_kelvin = data['main']['temp']
+        temp_f = (temp_kelvin - 273.15) * 9/5 + 32
+        condition = data['weather'][0]['main']
+        return round(temp_f, 1), condition
+    else:
+        print(f"Error fetching weather for zipcode {zipcode}: {response.status_code}")
+        return None, None
+
 def get_weather_historical_visual_crossing(zipcode: str, date: str, time_str: str, api_key: str = None):
     """
     Get historical weather using Visual Crossing API (free tier available).
@@ -101,26 +225,26 @@ def get_weather_historical_visual_crossing(zipcode: str, date: str, time_str: st
         # Visual Crossing API endpoint
         url = "https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline"
         
-        # Parse date and time
-        date_obj = datetime.strptime(date, '%Y-%m-%d')
-        date_str = date_obj.strftime('%Y-%m-%d')
-        
+        # Validate the date without a strptime/strftime round-trip
+        if not _DATE_RE.fullmatch(date):
+            raise ValueError(f"expected YYYY-MM-DD date, got {date!r}")
+
         # Visual Crossing uses location string (can use zipcode)
         location = f"{zipcode}"
-        
+
         params = {
             'location': location,
-            'date': date_str,
+            'date': date,
             'key': api_key,
             'unitGroup': 'us',  # Use US units (Fahrenheit)
             'include': 'hours'  # Include hourly data
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
-            
+            data = orjson.loads(response.content)
+
             # Get the day's data
             if 'days' in data and len(data['days']) > 0:
                 day_data = data['days'][0]
@@ -145,86 +269,321 @@ def get_weather_historical_visual_crossing(zipcode: str, date: str, time_str: st
         # Fallback to OpenWeatherMap
         return get_weather_by_zipcode(zipcode, date, time_str, None)
 
-def add_weather_to_games(games_file: str, output_file: str = None, api_provider: str = 'visual_crossing'):
+# Intra-run memo for the async OpenWeatherMap path; current-weather
+# responses depend only on the zipcode. Each zipcode maps to the future
+# of its one fetch, so concurrent tasks for the same stadium await the
+# same request while distinct zipcodes still fetch concurrently.
+_OWM_ASYNC_CACHE = {}
+
+async def _fetch_owm_current_async(session, zipcode: str, api_key: str):
+    """
+    Async fetch of current weather for a zipcode from OpenWeatherMap.
+
+    Args:
+        session: httpx.AsyncClient to fetch with
+        zipcode: 5-digit US zipcode
+        api_key: OpenWeatherMap API key
+
+    Returns:
+        Tuple of (temperature_fahrenheit, condition) or (None, None) if error
+    """
+    geo_url = f"{OPENWEATHER_API_BASE}/weather"
+    geo_params = {
+        'zip': f"{zipcode},US",
+        'appid': api_key
+    }
+
+    response = await session.get(geo_url, params=geo_params, timeout=10)
+    if response.status_code == 200:
+        data = orjson.loads(response.content)
+        temp_kelvin = data['main']['temp']
+        temp_f = (temp_kelvin - 273.15) * 9/5 + 32
+        condition = data['weather'][0]['main']
+        return round(temp_f, 1), condition
+    else:
+        print(f"Error fetching weather for zipcode {zipcode}: {response.status_code}")
+        return None, None
+
+async def get_weather_by_zipcode_async(session, zipcode: str, date: str, time_str: str,
+                                       api_key: str = None):
+    """
+    Async counterpart of get_weather_by_zipcode, fetching over a shared
+    httpx client so lookups reuse pooled keep-alive connections.
+
+    Args:
+        session: httpx.AsyncClient to fetch with
+        zipcode: 5-digit US zipcode
+        date: Date in YYYY-MM-DD format
+        time_str: Time in format like "8:20PM" or "1:00PM"
+        api_key: OpenWeatherMap API key (optional, can use env var)
+
+    Returns:
+        Tuple of (temperature_fahrenheit, condition) or (None, None) if error
+    """
+    if not api_key:
+        api_key = os.getenv('OPENWEATHER_API_KEY')
+
+    if not api_key:
+        print("Warning: No OpenWeatherMap API key found. Set OPENWEATHER_API_KEY environment variable.")
+        print("For historical weather data, you may need OpenWeatherMap One Call API 3.0 subscription.")
+        return None, None
+
+    try:
+        future = _OWM_ASYNC_CACHE.get(zipcode)
+        if future is None:
+            # No await between the check and the insert, so on the
+            # single-threaded event loop this is race-free without a lock
+            future = asyncio.ensure_future(
+                _fetch_owm_current_async(session, zipcode, api_key))
+            _OWM_ASYNC_CACHE[zipcode] = future
+
+        result = await future
+        if result == (None, None):
+            # Don't memoize failures; a later lookup may succeed
+            _OWM_ASYNC_CACHE.pop(zipcode, None)
+        return result
+
+    except Exception as e:
+        _OWM_ASYNC_CACHE.pop(zipcode, None)
+        print(f"Error getting weather for zipcode {zipcode}: {e}")
+        return None, None
+
+async def get_weather_historical_visual_crossing_async(session, zipcode: str, date: str,
+                                                       time_str: str, api_key: str = None):
+    """
+    Async counterpart of get_weather_historical_visual_crossing over a
+    shared httpx client.
+
+    Args:
+        session: httpx.AsyncClient to fetch with
+        zipcode: 5-digit US zipcode
+        date: Date in YYYY-MM-DD format
+        time_str: Time in format like "8:20PM" or "1:00PM"
+        api_key: Visual Crossing API key (optional, can use env var)
+
+    Returns:
+        Tuple of (temperature_fahrenheit, condition) or (None, None) if error
+    """
+    if not api_key:
+        api_key = os.getenv('VISUAL_CROSSING_API_KEY')
+
+    if not api_key:
+        # Try OpenWeatherMap as fallback
+        return await get_weather_by_zipcode_async(session, zipcode, date, time_str, None)
+
+    try:
+        # Visual Crossing API endpoint
+        url = "https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline"
+
+        # Validate the date without a strptime/strftime round-trip
+        if not _DATE_RE.fullmatch(date):
+            raise ValueError(f"expected YYYY-MM-DD date, got {date!r}")
+
+        params = {
+            'location': f"{zipcode}",
+            'date': date,
+            'key': api_key,
+            'unitGroup': 'us',  # Use US units (Fahrenheit)
+            'include': 'hours'  # Include hourly data
+        }
+
+        for attempt in range(3):
+            response = await session.get(url, params=params, timeout=10)
+            if response.status_code == 429:
+                # Honor the server's pacing if it tells us, otherwise
+                # back off exponentially before retrying
+                retry_after = response.headers.get('Retry-After')
+                delay = float(retry_after) if retry_after else 2 ** attempt
+                print(f"Rate limited by Visual Crossing, retrying in {delay:.0f}s...")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code == 200:
+                # If this request drained the quota window, pause until
+                # it resets instead of burning the remaining attempts
+                remaining = response.headers.get('X-RateLimit-Remaining')
+                if remaining is not None and remaining.isdigit() and int(remaining) == 0:
+                    await asyncio.sleep(1)
+
+                data = orjson.loads(response.content)
+
+                # Get the day's data
+                if 'days' in data and len(data['days']) > 0:
+                    day_data = data['days'][0]
+
+                    # For simplicity, use the day's average temp
+                    temp_f = day_data.get('temp', day_data.get('tempmax'))
+                    condition = day_data.get('conditions', 'Unknown')
+
+                    return round(temp_f, 1), condition
+                else:
+                    return None, None
+            else:
+                print(f"Error fetching weather from Visual Crossing for zipcode {zipcode}: {response.status_code}")
+                break
+
+        # Fallback to OpenWeatherMap
+        return await get_weather_by_zipcode_async(session, zipcode, date, time_str, None)
+
+    except Exception as e:
+        print(f"Error getting weather from Visual Crossing for zipcode {zipcode}: {e}")
+        # Fallback to OpenWeatherMap
+        return await get_weather_by_zipcode_async(session, zipcode, date, time_str, None)
+
+async def _resolve_weather(df, session, api_provider: str, limiter, row_offset: int = 0):
+    """
+    Resolve and attach weather for one frame of games in place.
+
+    Args:
+        df: Games DataFrame with verbatim string columns
+        session: httpx.AsyncClient to fetch with
+        api_provider: Weather API provider ('visual_crossing' or 'openweather')
+        limiter: TokenBucket shared by every lookup in the run
+        row_offset: Rows preceding this frame, for warning messages
+
+    Returns:
+        Tuple of (processed_count, error_count)
+    """
+    processed_count = 0
+    error_count = 0
+
+    # Add weather columns if they don't exist
+    if 'temperature' not in df.columns:
+        df['temperature'] = ''
+    if 'condition' not in df.columns:
+        df['condition'] = ''
+
+    if api_provider == 'visual_crossing':
+        fetch = get_weather_historical_visual_crossing_async
+    else:
+        fetch = get_weather_by_zipcode_async
+
+    dates = df['Date'].str.strip().tolist()
+    zipcodes = (df['zipcode'].str.strip().tolist() if 'zipcode' in df.columns
+                else [''] * len(df))
+    times = (df['Time'].str.strip().tolist() if 'Time' in df.columns
+             else [''] * len(df))
+
+    # Split lookup rows from rows with no date/zipcode (playoff separators
+    # and the like keep their existing values)
+    pending = []
+    for i, (date, zipcode) in enumerate(zip(dates, zipcodes)):
+        if date and zipcode:
+            pending.append(i)
+        elif date:
+            print(f"Warning: No zipcode for row {row_offset + i + 1}, "
+                  f"skipping weather lookup")
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def lookup(zipcode, date, time_str):
+        cached = cache_get(api_provider, zipcode, date)
+        if cached is not None:
+            return cached
+        # The semaphore bounds in-flight requests; the shared token
+        # bucket bounds the cumulative request rate across all of them
+        async with semaphore:
+            await limiter.acquire()
+            temp, condition = await fetch(session, zipcode, date, time_str)
+        if temp is not None and condition is not None:
+            cache_put(api_provider, zipcode, date, temp, condition)
+        return temp, condition
+
+    # Identical (zipcode, date) pairs — double-headers, Thanksgiving
+    # slates at one stadium — are fetched once and fanned back out to
+    # every matching row
+    unique = {}
+    for i in pending:
+        unique.setdefault((zipcodes[i], dates[i]), times[i])
+
+    print(f"Fetching weather for {len(pending)} games "
+          f"({len(unique)} unique lookups)...")
+    fetched = await asyncio.gather(
+        *(lookup(zipcode, date, time_str)
+          for (zipcode, date), time_str in unique.items()))
+    results = dict(zip(unique, fetched))
+
+    # Stitch results back into their rows by position
+    resolved, temps, conds = [], [], []
+    for i in pending:
+        temp, condition = results[(zipcodes[i], dates[i])]
+        if temp is not None and condition is not None:
+            resolved.append(i)
+            temps.append(str(temp))
+            conds.append(condition)
+            processed_count += 1
+        else:
+            error_count += 1
+    df.loc[df.index[resolved], 'temperature'] = temps
+    df.loc[df.index[resolved], 'condition'] = conds
+
+    return processed_count, error_count
+
+async def add_weather_to_games(games_file: str, output_file: str = None,
+                               api_provider: str = 'visual_crossing',
+                               chunksize: int = None):
     """
     Read games CSV and add weather temperature and condition columns.
-    
+
     Args:
         games_file: Path to games CSV file (e.g., 2024_games.csv)
         output_file: Path to output file (if None, overwrites input file)
         api_provider: Weather API provider ('visual_crossing' or 'openweather')
+        chunksize: If set, stream the CSV in chunks of this many rows so
+            peak memory stays bounded and completed chunks are already on
+            disk if a later one fails
     """
     if output_file is None:
         output_file = games_file
-    
-    rows = []
+
     processed_count = 0
     error_count = 0
-    
+    total_rows = 0
+
     print(f"Reading games from {games_file}...")
-    
-    # Read the CSV file
-    with open(games_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames)
-        
-        # Add weather columns if they don't exist
-        if 'temperature' not in fieldnames:
-            fieldnames.append('temperature')
-        if 'condition' not in fieldnames:
-            fieldnames.append('condition')
-        
-        for row in reader:
-            # Skip empty rows
-            if not row.get('Date') or not row.get('zipcode'):
-                row['temperature'] = row.get('temperature', '')
-                row['condition'] = row.get('condition', '')
-                rows.append(row)
-                continue
-            
-            date = row['Date'].strip()
-            time_str = row.get('Time', '').strip()
-            zipcode = row.get('zipcode', '').strip()
-            
-            if not zipcode:
-                print(f"Warning: No zipcode for row {processed_count + 1}, skipping weather lookup")
-                row['temperature'] = row.get('temperature', '')
-                row['condition'] = row.get('condition', '')
-                rows.append(row)
-                continue
-            
-            # Get weather data
-            if api_provider == 'visual_crossing':
-                temp, condition = get_weather_historical_visual_crossing(zipcode, date, time_str)
-            else:
-                temp, condition = get_weather_by_zipcode(zipcode, date, time_str)
-            
-            if temp is not None and condition is not None:
-                row['temperature'] = str(temp)
-                row['condition'] = condition
-                processed_count += 1
-            else:
-                row['temperature'] = row.get('temperature', '')
-                row['condition'] = row.get('condition', '')
-                error_count += 1
-            
-            rows.append(row)
-            
-            # Be respectful to API rate limits
-            time.sleep(0.5)  # Small delay between requests
-            
-            # Progress update
-            if (processed_count + error_count) % 10 == 0:
-                print(f"Processed {processed_count + error_count} games...")
-    
-    # Write updated data
-    print(f"\nWriting updated data to {output_file}...")
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    
-    print(f"\nSuccessfully processed {len(rows)} rows")
+
+    # Built here, inside the running loop, because asyncio primitives
+    # bind to the first loop that uses them; a module-level bucket would
+    # break a second asyncio.run(add_weather_to_games(...)) in the same
+    # process. One bucket spans every chunk so the cumulative rate holds.
+    limiter = TokenBucket(rate=REQUESTS_PER_SECOND)
+
+    # HTTP/2 multiplexes the concurrent lookups over one TLS connection
+    # per host instead of opening a socket per in-flight request
+    limits = httpx.Limits(max_keepalive_connections=MAX_CONCURRENT_FETCHES,
+                          max_connections=MAX_CONCURRENT_FETCHES)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=10) as session:
+        if chunksize:
+            # Chunked path: resolve and append one slice at a time. When
+            # overwriting in place, write to a temp file and swap at the
+            # end so the source is never read and truncated at once.
+            dest = output_file + '.tmp' if output_file == games_file else output_file
+            first = True
+            with open(dest, 'w', newline='', encoding='utf-8') as f:
+                for chunk in pd.read_csv(games_file, dtype=str,
+                                         keep_default_na=False, chunksize=chunksize):
+                    p, e = await _resolve_weather(chunk, session, api_provider,
+                                                  limiter, row_offset=total_rows)
+                    chunk.to_csv(f, index=False,
+                                 header=_restore_header(chunk.columns) if first else False)
+                    first = False
+                    processed_count += p
+                    error_count += e
+                    total_rows += len(chunk)
+            if dest != output_file:
+                os.replace(dest, output_file)
+        else:
+            # Read verbatim strings so untouched columns round-trip unchanged
+            df = pd.read_csv(games_file, dtype=str, keep_default_na=False)
+            processed_count, error_count = await _resolve_weather(
+                df, session, api_provider, limiter)
+            total_rows = len(df)
+
+            # Write updated data
+            print(f"\nWriting updated data to {output_file}...")
+            df.to_csv(output_file, index=False, header=_restore_header(df.columns))
+
+    print(f"\nSuccessfully processed {total_rows} rows")
     print(f"  - Weather data retrieved: {processed_count}")
     print(f"  - Errors/missing data: {error_count}")
 
@@ -252,8 +611,23 @@ def main():
         default='visual_crossing',
         help='Weather API provider (default: visual_crossing)'
     )
-    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the on-disk lookup cache and refetch everything'
+    )
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=None,
+        help='Process the input in chunks of this many rows (bounded memory)'
+    )
+
     args = parser.parse_args()
+
+    if args.no_cache:
+        global USE_CACHE
+        USE_CACHE = False
     
     print("=" * 70)
     print("NFL Games Weather Data Adder")
@@ -277,7 +651,8 @@ def main():
             print("You can get a free API key at: https://openweathermap.org/api")
             print()
     
-    add_weather_to_games(args.games_file, args.output, args.api)
+    asyncio.run(add_weather_to_games(args.games_file, args.output, args.api,
+                                     chunksize=args.chunksize))
     
     print()
     print("=" * 70)